@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import ast
 import symtable
-from typing import Dict, Set
+import sys
+from typing import Dict, FrozenSet, Set
 
-from .symtable_utils import _table_frees
+from .symtable_utils import _contains_yield, _table_frees
 
 
 def _build_symtable(source: str, filename: str) -> symtable.SymbolTable:
@@ -24,6 +25,20 @@ def _build_symtable(source: str, filename: str) -> symtable.SymbolTable:
         raise
 
 
+_SUSPENDING_EXPR_TYPES = frozenset((ast.Await, ast.Yield, ast.YieldFrom))
+_COMPREHENSION_EXPR_TYPES = frozenset((ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp))
+
+
+# Name categories used by FunctionScope to resolve a name with one lookup.
+# ScopeInfo.slots maps each name to a (kind, index) pair; names missing from it
+# are implicit globals/builtins.
+NAME_LOCAL = 0
+NAME_CELL = 1
+NAME_FREE = 2
+NAME_GLOBAL = 3
+NAME_IMPLICIT = 4
+
+
 class ScopeInfo:
     """
     Per-function scope info needed for runtime name resolution.
@@ -31,12 +46,43 @@ class ScopeInfo:
 
     def __init__(self, table: symtable.Function, cellvars: Set[str]):
         self.table = table
-        self.locals: Set[str] = set(table.get_locals())
-        self.frees: Set[str] = set(table.get_frees())
-        self.cellvars: Set[str] = set(cellvars)
-        self.declared_globals: Set[str] = {
-            s.get_name() for s in table.get_symbols() if s.is_declared_global()
-        }
+        # Interned so lookups keyed by parser identifiers (which CPython
+        # interns) match by identity before falling back to string compares.
+        intern = sys.intern
+        self.local_names: tuple[str, ...] = tuple(intern(name) for name in table.get_locals())
+        self.locals: FrozenSet[str] = frozenset(self.local_names)
+        # Ordered like CPython's co_freevars; a free var's index selects its
+        # Cell in UserFunction.free_cells.
+        self.free_names: tuple[str, ...] = tuple(intern(name) for name in table.get_frees())
+        self.frees: FrozenSet[str] = frozenset(self.free_names)
+        self.cellvars: FrozenSet[str] = frozenset(intern(name) for name in cellvars)
+        self.declared_globals: FrozenSet[str] = frozenset(
+            intern(s.get_name()) for s in table.get_symbols() if s.is_declared_global()
+        )
+        # Plain locals and cellvars get separate index spaces: FunctionScope
+        # keeps values in its fast-locals list and Cells in its cells tuple,
+        # so neither needs a type check to tell the two apart.
+        self.local_indices: Dict[str, int] = {}
+        self.cell_indices: Dict[str, int] = {}
+        for name in self.local_names:
+            if name in self.cellvars:
+                self.cell_indices[name] = len(self.cell_indices)
+            else:
+                self.local_indices[name] = len(self.local_indices)
+        self.num_locals = len(self.local_indices)
+        self.num_cells = len(self.cell_indices)
+
+        # Later assignments win, mirroring the precedence FunctionScope.store
+        # used when it tested these sets in turn.
+        self.slots: Dict[str, tuple[int, int]] = {}
+        for name, index in self.local_indices.items():
+            self.slots[name] = (NAME_LOCAL, index)
+        for name, index in self.cell_indices.items():
+            self.slots[name] = (NAME_CELL, index)
+        for index, name in enumerate(self.free_names):
+            self.slots[name] = (NAME_FREE, index)
+        for name in self.declared_globals:
+            self.slots[name] = (NAME_GLOBAL, -1)
 
 
 class ModuleCode:
@@ -48,15 +94,25 @@ class ModuleCode:
       - computed cellvars for each function table
     """
 
-    def __init__(self, source: str, filename: str = "<pynterp>"):
+    def __init__(self, source: str, filename: str = "<pynterp>", *, tree: ast.Module | None = None):
         self.source = source
         self.filename = filename
-        self.tree = ast.parse(source, filename=filename, mode="exec")
+        # Callers that already parsed `source` (e.g. the module loader cache) can
+        # hand over the tree to skip a second parse.
+        self.tree = tree if tree is not None else ast.parse(source, filename=filename, mode="exec")
         self.sym_root = _build_symtable(source, filename)
 
         self._tables_by_key: Dict[tuple[str, str, int], list[symtable.SymbolTable]] = {}
         self._cellvars_by_id: Dict[int, Set[str]] = {}
+        self._scope_info_by_id: Dict[int, ScopeInfo] = {}
+        self._function_info_by_node: Dict[ast.AST, tuple[ScopeInfo, bool]] = {}
+        self._lambda_scope_info_by_node: Dict[ast.AST, ScopeInfo] = {}
         self._lambda_occurrence_by_location: Dict[tuple[int, int], int] = {}
+        self._annotation_nodes_by_node: Dict[ast.AST, tuple[tuple[str, ast.expr], ...]] = {}
+        self._sequence_pattern_layout_by_node: Dict[
+            ast.AST, tuple[tuple[ast.pattern, ...], ast.MatchStar | None, tuple[ast.pattern, ...]]
+        ] = {}
+        self._expr_can_suspend_by_node: Dict[ast.AST, bool] = {}
 
         self._index_tables(self.sym_root)
         self._index_lambda_occurrences()
@@ -87,9 +143,9 @@ class ModuleCode:
 
         class Visitor(ast.NodeVisitor):
             def _visit_lambda_default_exprs(self, node: ast.Lambda) -> None:
-                for default in node.args.defaults or []:
+                for default in node.args.defaults:
                     self.visit(default)
-                for kw_default in getattr(node.args, "kw_defaults", []) or []:
+                for kw_default in node.args.kw_defaults:
                     if kw_default is not None:
                         self.visit(kw_default)
 
@@ -147,4 +203,89 @@ class ModuleCode:
         return tbl
 
     def scope_info_for(self, fn_table: symtable.Function) -> ScopeInfo:
-        return ScopeInfo(fn_table, self._cellvars_by_id.get(fn_table.get_id(), set()))
+        # ScopeInfo is immutable once built, so every execution of the same
+        # def/lambda shares one instance.
+        table_id = fn_table.get_id()
+        scope_info = self._scope_info_by_id.get(table_id)
+        if scope_info is None:
+            scope_info = ScopeInfo(fn_table, self._cellvars_by_id.get(table_id, set()))
+            self._scope_info_by_id[table_id] = scope_info
+        return scope_info
+
+    def function_info(
+        self, fn_node: ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> tuple[ScopeInfo, bool]:
+        # The symtable lookup and yield scan only depend on the AST, so a def
+        # that runs repeatedly (e.g. inside a loop or factory) pays for them once.
+        info = self._function_info_by_node.get(fn_node)
+        if info is None:
+            scope_info = self.scope_info_for(self.lookup_function_table(fn_node))
+            info = (scope_info, _contains_yield(fn_node))
+            self._function_info_by_node[fn_node] = info
+        return info
+
+    def lambda_scope_info(self, lambda_node: ast.Lambda) -> ScopeInfo:
+        scope_info = self._lambda_scope_info_by_node.get(lambda_node)
+        if scope_info is None:
+            scope_info = self.scope_info_for(self.lookup_lambda_table(lambda_node))
+            self._lambda_scope_info_by_node[lambda_node] = scope_info
+        return scope_info
+
+    def function_annotation_nodes(
+        self, fn_node: ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> tuple[tuple[str, ast.expr], ...]:
+        # (key, annotation) pairs in __annotations__ order; most defs have none.
+        nodes = self._annotation_nodes_by_node.get(fn_node)
+        if nodes is None:
+            args = fn_node.args
+            pairs: list[tuple[str, ast.expr]] = []
+            for arg in (*args.posonlyargs, *args.args):
+                if arg.annotation is not None:
+                    pairs.append((arg.arg, arg.annotation))
+            if args.vararg is not None and args.vararg.annotation is not None:
+                pairs.append((args.vararg.arg, args.vararg.annotation))
+            for arg in args.kwonlyargs:
+                if arg.annotation is not None:
+                    pairs.append((arg.arg, arg.annotation))
+            if args.kwarg is not None and args.kwarg.annotation is not None:
+                pairs.append((args.kwarg.arg, args.kwarg.annotation))
+            if fn_node.returns is not None:
+                pairs.append(("return", fn_node.returns))
+            nodes = tuple(pairs)
+            self._annotation_nodes_by_node[fn_node] = nodes
+        return nodes
+
+    def sequence_pattern_layout(
+        self, pattern: ast.MatchSequence
+    ) -> tuple[tuple[ast.pattern, ...], ast.MatchStar | None, tuple[ast.pattern, ...]]:
+        # Split around the (at most one) star pattern once per node rather than
+        # once per matched subject.
+        layout = self._sequence_pattern_layout_by_node.get(pattern)
+        if layout is None:
+            patterns = tuple(pattern.patterns)
+            for index, subpattern in enumerate(patterns):
+                if subpattern.__class__ is ast.MatchStar:
+                    layout = (patterns[:index], subpattern, patterns[index + 1 :])
+                    break
+            else:
+                layout = (patterns, None, ())
+            self._sequence_pattern_layout_by_node[pattern] = layout
+        return layout
+
+    def expr_can_suspend(self, expr: ast.AST) -> bool:
+        # Generator-mode evaluation only needs to step through expressions that
+        # may yield or await; anything else can run on the plain eval path. The
+        # scan is conservative and also counts lambda/genexp bodies.
+        can_suspend = self._expr_can_suspend_by_node.get(expr)
+        if can_suspend is None:
+            can_suspend = False
+            for node in ast.walk(expr):
+                cls = node.__class__
+                if cls in _SUSPENDING_EXPR_TYPES or (
+                    cls in _COMPREHENSION_EXPR_TYPES
+                    and any(gen.is_async for gen in node.generators)
+                ):
+                    can_suspend = True
+                    break
+            self._expr_can_suspend_by_node[expr] = can_suspend
+        return can_suspend
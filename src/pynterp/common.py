@@ -23,6 +23,14 @@ class ContinueSignal(ControlFlowSignal):
     pass
 
 
+# Loop-control statuses returned by exec_block/g_exec_block (None means the
+# block ran to completion). Plain break/continue travel as return values;
+# blocks whose unwinding semantics rely on exceptions (try bodies, handlers
+# and finally clauses) convert them to BreakSignal/ContinueSignal.
+STATUS_CONTINUE = 1
+STATUS_BREAK = 2
+
+
 class AwaitRequest:
     """Internal value used to hand awaitables from the AST runner to async trampoline."""
 
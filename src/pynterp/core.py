@@ -2,7 +2,7 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, Iterator, Optional, Set
+from typing import Any, Callable, Dict, Iterator, Optional, Set
 
 from pynterp.lib import (
     InterpretedModuleLoader,
@@ -14,8 +14,35 @@ from pynterp.lib.compat import maybe_patch_runtime_module
 from pynterp.lib.membrane import HostMembrane
 
 from .code import ModuleCode
+from .common import STATUS_BREAK, BreakSignal, ContinueSignal
 from .scopes import ModuleScope, RuntimeScope
 
+_HANDLER_PREFIXES = ("exec_", "eval_", "g_exec_", "g_eval_")
+_AST_EXPR = ast.Expr
+_AST_PASS = ast.Pass
+# Per interpreter class: prefix -> ((ast node type, handler method name), ...).
+_HANDLER_NAMES_BY_CLASS: Dict[type, Dict[str, tuple[tuple[type, str], ...]]] = {}
+
+
+def _handler_names_for_class(cls: type) -> Dict[str, tuple[tuple[type, str], ...]]:
+    names = _HANDLER_NAMES_BY_CLASS.get(cls)
+    if names is not None:
+        return names
+    found: Dict[str, list[tuple[type, str]]] = {prefix: [] for prefix in _HANDLER_PREFIXES}
+    for attr in dir(cls):
+        for prefix in _HANDLER_PREFIXES:
+            if not attr.startswith(prefix):
+                continue
+            node_name = attr[len(prefix) :]
+            # Skip helpers such as exec_block/eval_expr; AST node classes are
+            # CapWords and this runtime may lack newer ones (e.g. TypeAlias).
+            node_type = getattr(ast, node_name, None) if node_name[:1].isupper() else None
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                found[prefix].append((node_type, attr))
+    names = {prefix: tuple(pairs) for prefix, pairs in found.items()}
+    _HANDLER_NAMES_BY_CLASS[cls] = names
+    return names
+
 
 @dataclass(slots=True)
 class RunResult:
@@ -32,6 +59,10 @@ class RunResult:
 
 
 class InterpreterCore:
+    # (pattern node type, matcher method name) pairs; StatementMixin fills
+    # these in and __init__ binds them like the exec_/eval_ handlers.
+    _MATCH_PATTERN_HANDLER_NAMES: tuple[tuple[type, str], ...] = ()
+
     def __init__(
         self, allowed_imports: Optional[Set[str]] = None, allow_relative_imports: bool = False
     ):
@@ -44,6 +75,17 @@ class InterpreterCore:
         self.allowed_imports = None if allowed_imports is None else set(allowed_imports)
         self.allow_relative_imports = bool(allow_relative_imports)
         self._host_membrane = HostMembrane()
+        # Node type -> bound handler, so dispatch is one dict probe instead
+        # of formatting "exec_<Name>" and a getattr per node.
+        handler_names = _handler_names_for_class(type(self))
+        self._exec_handlers = self._bind_handlers(handler_names["exec_"])
+        self._eval_handlers = self._bind_handlers(handler_names["eval_"])
+        self._g_exec_handlers = self._bind_handlers(handler_names["g_exec_"])
+        self._g_eval_handlers = self._bind_handlers(handler_names["g_eval_"])
+        self._match_pattern_handlers = self._bind_handlers(self._MATCH_PATTERN_HANDLER_NAMES)
+
+    def _bind_handlers(self, pairs: tuple[tuple[type, str], ...]) -> Dict[type, Callable[..., Any]]:
+        return {node_type: getattr(self, attr) for node_type, attr in pairs}
 
     # ----- restricted import -----
 
@@ -119,10 +161,18 @@ class InterpreterCore:
 
     # ----- run -----
 
-    def run(self, source: str, env: dict, filename: str = "<pynterp>") -> RunResult:
+    def run(
+        self,
+        source: str,
+        env: dict,
+        filename: str = "<pynterp>",
+        *,
+        tree: ast.Module | None = None,
+    ) -> RunResult:
         """
         Execute `source` in a fresh AST interpreter module environment.
 
+        `tree` may be a pre-parsed AST of `source` to skip re-parsing.
         Returns a RunResult with globals and any uncaught exception.
         """
         if not isinstance(env, dict):
@@ -144,7 +194,7 @@ class InterpreterCore:
             self._host_membrane.adapt_env_in_place(globals_dict)
 
         try:
-            code = ModuleCode(source, filename)
+            code = ModuleCode(source, filename, tree=tree)
             scope = ModuleScope(code, globals_dict, builtins_dict)
             self.exec_module(code.tree, scope)
         except BaseException as exc:
@@ -170,31 +220,66 @@ class InterpreterCore:
             signature=None,
         )
 
-    def run_or_raise(self, source: str, env: dict, filename: str = "<pynterp>") -> dict:
-        result = self.run(source, env, filename)
+    def run_or_raise(
+        self,
+        source: str,
+        env: dict,
+        filename: str = "<pynterp>",
+        *,
+        tree: ast.Module | None = None,
+    ) -> dict:
+        result = self.run(source, env, filename, tree=tree)
         result.raise_for_exception()
         return result.globals
 
     # ----- dispatch (normal) -----
 
     def exec_module(self, node: ast.Module, scope: RuntimeScope) -> None:
-        for stmt in node.body:
-            self.exec_stmt(stmt, scope)
+        self.exec_block_raising(node.body, scope)
 
-    def exec_block(self, stmts: list[ast.stmt], scope: RuntimeScope) -> None:
+    def exec_block(self, stmts: list[ast.stmt], scope: RuntimeScope) -> int | None:
+        """Run `stmts`; return a STATUS_* code if a break/continue left the block."""
+        handlers = self._exec_handlers
         for stmt in stmts:
-            self.exec_stmt(stmt, scope)
-
-    def exec_stmt(self, node: ast.AST, scope: RuntimeScope) -> None:
-        m = getattr(self, f"exec_{node.__class__.__name__}", None)
+            cls = stmt.__class__
+            if cls is _AST_EXPR:
+                # Expression statements go straight to the value's eval handler,
+                # skipping the exec_Expr/eval_expr frames.
+                value = stmt.value
+                m = self._eval_handlers.get(value.__class__)
+                if m is None:
+                    self.eval_expr(value, scope)
+                else:
+                    m(value, scope)
+                continue
+            if cls is _AST_PASS:
+                continue
+            m = handlers.get(cls)
+            status = self.exec_stmt(stmt, scope) if m is None else m(stmt, scope)
+            if status is not None:
+                return status
+        return None
+
+    def exec_block_raising(self, stmts: list[ast.stmt], scope: RuntimeScope) -> None:
+        """Run `stmts`, turning a break/continue status into its ControlFlowSignal."""
+        status = self.exec_block(stmts, scope)
+        if status is not None:
+            raise BreakSignal() if status == STATUS_BREAK else ContinueSignal()
+
+    def exec_stmt(self, node: ast.AST, scope: RuntimeScope) -> int | None:
+        m = self._exec_handlers.get(node.__class__)
         if m is None:
-            raise NotImplementedError(f"Statement not supported: {node.__class__.__name__}")
-        m(node, scope)
+            m = getattr(self, f"exec_{node.__class__.__name__}", None)
+            if m is None:
+                raise NotImplementedError(f"Statement not supported: {node.__class__.__name__}")
+        return m(node, scope)
 
     def eval_expr(self, node: ast.AST, scope: RuntimeScope) -> Any:
-        m = getattr(self, f"eval_{node.__class__.__name__}", None)
+        m = self._eval_handlers.get(node.__class__)
         if m is None:
-            raise NotImplementedError(f"Expression not supported: {node.__class__.__name__}")
+            m = getattr(self, f"eval_{node.__class__.__name__}", None)
+            if m is None:
+                raise NotImplementedError(f"Expression not supported: {node.__class__.__name__}")
         return m(node, scope)
 
     # ----- dispatch (generator-mode) -----
@@ -202,21 +287,33 @@ class InterpreterCore:
 
     def g_exec_block(self, stmts: list[ast.stmt], scope: RuntimeScope) -> Iterator[Any]:
         for stmt in stmts:
-            yield from self.g_exec_stmt(stmt, scope)
+            cls = stmt.__class__
+            if cls is _AST_EXPR:
+                yield from self.g_eval_expr(stmt.value, scope)
+                continue
+            if cls is _AST_PASS:
+                continue
+            status = yield from self.g_exec_stmt(stmt, scope)
+            if status is not None:
+                return status
+        return None
+
+    def g_exec_block_raising(self, stmts: list[ast.stmt], scope: RuntimeScope) -> Iterator[Any]:
+        status = yield from self.g_exec_block(stmts, scope)
+        if status is not None:
+            raise BreakSignal() if status == STATUS_BREAK else ContinueSignal()
 
     def g_exec_stmt(self, node: ast.AST, scope: RuntimeScope) -> Iterator[Any]:
-        m = getattr(self, f"g_exec_{node.__class__.__name__}", None)
+        m = self._g_exec_handlers.get(node.__class__)
         if m is None:
             # fallback: run a non-yielding statement
-            self.exec_stmt(node, scope)
-            return
-        yield from m(node, scope)
-        if False:
-            yield None  # keeps it a generator in all branches
+            return self.exec_stmt(node, scope)
+        status = yield from m(node, scope)
+        return status
 
     def g_eval_expr(self, node: ast.AST, scope: RuntimeScope) -> Iterator[Any]:
-        m = getattr(self, f"g_eval_{node.__class__.__name__}", None)
-        if m is None:
+        m = self._g_eval_handlers.get(node.__class__)
+        if m is None or not scope.code.expr_can_suspend(node):
             return self.eval_expr(node, scope)
         val = yield from m(node, scope)
         return val
@@ -4,13 +4,21 @@ import ast
 import builtins
 from typing import Any, Callable, Dict, Iterator
 
+from .code import NAME_FREE, NAME_LOCAL
 from .common import NO_DEFAULT, UNBOUND, AwaitRequest
 from .functions import UserFunction
 from .helpers import InterpretedAsyncGenerator
 from .host_exec import safe_host_eval, safe_host_exec
 from .lib.builtins import SafeExposedCallableBase, is_safe_builtin_callable, wrap_safe_callable
 from .lib.guards import is_sensitive_host_annotation_runtime_value, safe_getattr, safe_vars
-from .scopes import ClassBodyScope, ComprehensionScope, FunctionScope, ModuleScope, RuntimeScope
+from .scopes import (
+    SCOPE_CLASS,
+    SCOPE_COMPREHENSION,
+    SCOPE_FUNCTION,
+    SCOPE_MODULE,
+    ComprehensionScope,
+    RuntimeScope,
+)
 from .symtable_utils import _collect_comprehension_locals
 
 _NO_SUPER = object()
@@ -125,17 +133,18 @@ class ExpressionMixin:
             return _NO_SUPER
 
         func_obj, call_scope = call_stack[-1]
-        class_cell = func_obj.closure.get("__class__")
+        slot = func_obj.scope_info.slots.get("__class__")
+        class_cell = func_obj.free_cells[slot[1]] if slot and slot[0] == NAME_FREE else None
         if class_cell is None or class_cell.value is UNBOUND:
             raise RuntimeError("super(): __class__ cell not found")
 
-        params = (getattr(func_obj.node.args, "posonlyargs", []) or []) + (
-            getattr(func_obj.node.args, "args", []) or []
-        )
+        # The cached layout holds the (mangled) positional names call binding
+        # stored the arguments under.
+        params = self._parameter_layout(func_obj)[0]
         if not params:
             raise RuntimeError("super(): no arguments")
 
-        first_arg_name = params[0].arg
+        first_arg_name = params[0]
         try:
             first_arg_value = call_scope.load(first_arg_name)
         except Exception as exc:  # pragma: no cover - defensive fallback
@@ -144,25 +153,31 @@ class ExpressionMixin:
         return builtins.super(class_cell.value, first_arg_value)
 
     def _default_exec_eval_locals(self, scope: RuntimeScope) -> dict[str, Any]:
-        if isinstance(scope, ModuleScope):
+        kind = scope.SCOPE_KIND
+        if kind == SCOPE_MODULE:
             return scope.globals
-        if isinstance(scope, ClassBodyScope):
+        if kind == SCOPE_CLASS:
             return scope.class_ns
-        if isinstance(scope, FunctionScope):
+        if kind == SCOPE_FUNCTION:
             locals_dict: dict[str, Any] = {}
-            for name in scope.scope_info.locals:
-                try:
-                    locals_dict[name] = scope.load(name)
-                except (NameError, UnboundLocalError):
-                    continue
-            for name in scope.scope_info.frees:
+            scope_info = scope.scope_info
+            slots = scope_info.slots
+            for name in scope_info.local_names:
+                slot_kind, index = slots[name]
+                if slot_kind == NAME_LOCAL:
+                    value = scope.load_fast(index)
+                else:
+                    value = scope.load_deref(index)
+                if value is not UNBOUND:
+                    locals_dict[name] = value
+            for name in scope_info.free_names:
                 try:
                     locals_dict[name] = scope.load(name)
                 except NameError:
                     continue
             return locals_dict
-        if isinstance(scope, ComprehensionScope):
-            return dict(scope.locals)
+        if kind == SCOPE_COMPREHENSION:
+            return scope.bound_locals()
         return scope.globals
 
     def _compile_exec_eval_source(self, source: Any, mode: str) -> Any:
@@ -319,7 +334,7 @@ class ExpressionMixin:
 
     def _namedexpr_store_scope(self, scope: RuntimeScope) -> RuntimeScope:
         target_scope = scope
-        while isinstance(target_scope, ComprehensionScope):
+        while target_scope.SCOPE_KIND == SCOPE_COMPREHENSION:
             target_scope = target_scope.outer_scope
         return target_scope
 
@@ -337,14 +352,14 @@ class ExpressionMixin:
         return value
 
     def eval_Lambda(self, node: ast.Lambda, scope: RuntimeScope) -> UserFunction:
-        defaults = [self.eval_expr(d, scope) for d in (node.args.defaults or [])]
+        defaults = [self.eval_expr(d, scope) for d in node.args.defaults]
         kw_defaults = [
             (self.eval_expr(d, scope) if d is not None else NO_DEFAULT)
-            for d in (getattr(node.args, "kw_defaults", []) or [])
+            for d in node.args.kw_defaults
         ]
-        lambda_table = scope.code.lookup_lambda_table(node)
-        lambda_scope_info = scope.code.scope_info_for(lambda_table)
-        closure = {name: scope.capture_cell(name) for name in lambda_scope_info.frees}
+        lambda_scope_info = scope.code.lambda_scope_info(node)
+        free_names = lambda_scope_info.free_names
+        free_cells = [scope.capture_cell(name) for name in free_names] if free_names else ()
         return UserFunction(
             interpreter=self,
             node=node,
@@ -352,12 +367,12 @@ class ExpressionMixin:
             globals_dict=scope.globals,
             builtins_dict=scope.builtins,
             scope_info=lambda_scope_info,
-            closure=closure,
+            free_cells=free_cells,
             defaults=defaults,
             kw_defaults=kw_defaults,
             is_generator=False,
             qualname=self._qualname_for_definition("<lambda>", scope),
-            private_owner=getattr(scope, "private_owner", None),
+            private_owner=scope.private_owner,
         )
 
     def eval_Call(self, node: ast.Call, scope: RuntimeScope) -> Any:
@@ -490,7 +505,7 @@ class ExpressionMixin:
 
     def eval_ListComp(self, node: ast.ListComp, scope: RuntimeScope) -> list:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -523,7 +538,7 @@ class ExpressionMixin:
 
     def eval_SetComp(self, node: ast.SetComp, scope: RuntimeScope) -> set:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -554,7 +569,7 @@ class ExpressionMixin:
 
     def eval_DictComp(self, node: ast.DictComp, scope: RuntimeScope) -> dict:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -595,7 +610,7 @@ class ExpressionMixin:
         outer_iter = self.eval_expr(gens[0].iter, scope)
 
         def gen() -> Iterator[Any]:
-            comp_scope = ComprehensionScope(
+            comp_scope = ComprehensionScope.for_targets(
                 scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
             )
 
@@ -632,15 +647,8 @@ class ExpressionMixin:
     # Generator-mode implementations
     # ----------------------------
 
-    # Statements
-
-    def g_eval_Constant(self, node: ast.Constant, scope: RuntimeScope) -> Iterator[Any]:
-        return node.value
-        yield
-
-    def g_eval_Name(self, node: ast.Name, scope: RuntimeScope) -> Iterator[Any]:
-        return scope.load(self._mangle_private_name(node.id, scope))
-        yield
+    # Expressions that cannot suspend (Constant, Name, ...) have no g_eval_*
+    # twin: g_eval_expr falls back to eval_expr for them.
 
     def g_eval_BinOp(self, node: ast.BinOp, scope: RuntimeScope) -> Iterator[Any]:
         left = yield from self.g_eval_expr(node.left, scope)
@@ -700,18 +708,18 @@ class ExpressionMixin:
 
     def g_eval_Lambda(self, node: ast.Lambda, scope: RuntimeScope) -> Iterator[UserFunction]:
         defaults: list[Any] = []
-        for default_node in node.args.defaults or []:
+        for default_node in node.args.defaults:
             defaults.append((yield from self.g_eval_expr(default_node, scope)))
         kw_defaults: list[Any] = []
-        for default_node in getattr(node.args, "kw_defaults", []) or []:
+        for default_node in node.args.kw_defaults:
             kw_defaults.append(
                 (yield from self.g_eval_expr(default_node, scope))
                 if default_node is not None
                 else NO_DEFAULT
             )
-        lambda_table = scope.code.lookup_lambda_table(node)
-        lambda_scope_info = scope.code.scope_info_for(lambda_table)
-        closure = {name: scope.capture_cell(name) for name in lambda_scope_info.frees}
+        lambda_scope_info = scope.code.lambda_scope_info(node)
+        free_names = lambda_scope_info.free_names
+        free_cells = [scope.capture_cell(name) for name in free_names] if free_names else ()
         return UserFunction(
             interpreter=self,
             node=node,
@@ -719,12 +727,12 @@ class ExpressionMixin:
             globals_dict=scope.globals,
             builtins_dict=scope.builtins,
             scope_info=lambda_scope_info,
-            closure=closure,
+            free_cells=free_cells,
             defaults=defaults,
             kw_defaults=kw_defaults,
             is_generator=False,
             qualname=self._qualname_for_definition("<lambda>", scope),
-            private_owner=getattr(scope, "private_owner", None),
+            private_owner=scope.private_owner,
         )
 
     def g_eval_Call(self, node: ast.Call, scope: RuntimeScope) -> Iterator[Any]:
@@ -890,7 +898,7 @@ class ExpressionMixin:
 
     def g_eval_ListComp(self, node: ast.ListComp, scope: RuntimeScope) -> Iterator[list]:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -924,7 +932,7 @@ class ExpressionMixin:
 
     def g_eval_SetComp(self, node: ast.SetComp, scope: RuntimeScope) -> Iterator[set]:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -958,7 +966,7 @@ class ExpressionMixin:
 
     def g_eval_DictComp(self, node: ast.DictComp, scope: RuntimeScope) -> Iterator[dict]:
         locals_set = _collect_comprehension_locals(node.generators)
-        comp_scope = ComprehensionScope(
+        comp_scope = ComprehensionScope.for_targets(
             scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
         )
 
@@ -1031,7 +1039,7 @@ class ExpressionMixin:
         if has_async:
 
             def make_async_gen() -> Iterator[Any]:
-                comp_scope = ComprehensionScope(
+                comp_scope = ComprehensionScope.for_targets(
                     scope.code,
                     scope.globals,
                     scope.builtins,
@@ -1065,7 +1073,7 @@ class ExpressionMixin:
             return InterpretedAsyncGenerator(make_async_gen())
 
         def make_gen() -> Iterator[Any]:
-            comp_scope = ComprehensionScope(
+            comp_scope = ComprehensionScope.for_targets(
                 scope.code, scope.globals, scope.builtins, outer_scope=scope, local_names=locals_set
             )
 
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import ast
 import copy
+import functools
 import importlib
 import inspect
+import sys
 import weakref
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Sequence
 
 from .code import ModuleCode, ScopeInfo
 from .common import NO_DEFAULT, Cell
@@ -33,15 +35,23 @@ def _load_user_function_global(module_name: str, qualname: str) -> Any:
     return _resolve_qualname_attr(module, qualname)
 
 
-def _mangle_private_name_for_owner(name: str, private_owner: str | None) -> str:
-    if not private_owner or not isinstance(name, str):
-        return name
+@functools.lru_cache(maxsize=4096)
+def _mangle_private_name_cached(name: str, private_owner: str) -> str:
+    # The same (name, owner) pairs recur on every load/store inside a class body
+    # or method, so the string checks and formatting run once per pair.
     if not name.startswith("__") or name.endswith("__") or "." in name:
         return name
     owner = private_owner.lstrip("_")
     if not owner:
         return name
-    return f"_{owner}{name}"
+    # Interned like parser identifiers so ScopeInfo lookups hit by identity.
+    return sys.intern(f"_{owner}{name}")
+
+
+def _mangle_private_name_for_owner(name: str, private_owner: str | None) -> str:
+    if not private_owner or not isinstance(name, str):
+        return name
+    return _mangle_private_name_cached(name, private_owner)
 
 
 def _contains_non_none_return(fn_node: ast.FunctionDef) -> bool:
@@ -101,13 +111,11 @@ def _build_user_function_signature(
     parameters: list[inspect.Parameter] = []
     empty = inspect.Parameter.empty
 
-    positional_args = list(getattr(args, "posonlyargs", []) or []) + list(
-        getattr(args, "args", []) or []
-    )
+    positional_args = [*args.posonlyargs, *args.args]
     default_start = max(0, len(positional_args) - len(defaults))
 
     for index, arg_node in enumerate(positional_args):
-        if index < len(getattr(args, "posonlyargs", []) or []):
+        if index < len(args.posonlyargs):
             kind = inspect.Parameter.POSITIONAL_ONLY
         else:
             kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
@@ -158,6 +166,13 @@ def _build_user_function_signature(
     return inspect.Signature(parameters, return_annotation=annotations.get("return", empty))
 
 
+# Every __annotate__ wrapper has the same ``(format, /)`` signature; building it
+# once keeps inspect.signature() off the function-definition path.
+_USER_FUNCTION_ANNOTATE_SIGNATURE = inspect.Signature(
+    [inspect.Parameter("format", inspect.Parameter.POSITIONAL_ONLY)]
+)
+
+
 def _make_user_function_annotate(user_function: "UserFunction"):
     def __annotate__(format, /):
         return dict(user_function.__annotations__)
@@ -167,6 +182,7 @@ def _make_user_function_annotate(user_function: "UserFunction"):
         "__annotate__",
         __annotate__,
         qualname=f"{qualname}.__annotate__",
+        signature=_USER_FUNCTION_ANNOTATE_SIGNATURE,
     )
 
 
@@ -181,7 +197,7 @@ def adapt_user_function_for_interpreters_run_func(func: "UserFunction") -> Any:
         raise ValueError("_interpreters.run_func() requires a function defined with 'def'")
     if func.is_generator or func.is_async or func.is_async_generator:
         raise ValueError("_interpreters.run_func() does not support generators or async functions")
-    if func.closure:
+    if func.free_cells:
         raise ValueError("_interpreters.run_func() does not support closures")
 
     args = prepared_node.args
@@ -238,7 +254,7 @@ class UserFunction:
         "globals",
         "builtins",
         "scope_info",
-        "closure",
+        "free_cells",
         "defaults",
         "kw_defaults",
         "__defaults__",
@@ -253,6 +269,7 @@ class UserFunction:
         "__type_params__",
         "__signature__",
         "_private_owner",
+        "_parameter_layout",
     )
 
     def __init__(
@@ -263,9 +280,9 @@ class UserFunction:
         globals_dict: dict,
         builtins_dict: dict,
         scope_info: ScopeInfo,
-        closure: Dict[str, Cell],
-        defaults: list[Any],
-        kw_defaults: list[Any],
+        free_cells: Sequence[Cell],
+        defaults: Sequence[Any],
+        kw_defaults: Sequence[Any],
         is_generator: bool,
         is_async: bool = False,
         is_async_generator: bool = False,
@@ -279,11 +296,12 @@ class UserFunction:
         self.globals = globals_dict
         self.builtins = builtins_dict
         self.scope_info = scope_info
-        self.closure = dict(closure)
+        # Ordered like scope_info.free_names; FunctionScope indexes it by free-var slot.
+        self.free_cells = tuple(free_cells)
         self.defaults = list(defaults)
         self.kw_defaults = list(kw_defaults)
         self.__defaults__ = tuple(self.defaults) if self.defaults else None
-        kwonlyargs = list(getattr(node.args, "kwonlyargs", []) or [])
+        kwonlyargs = node.args.kwonlyargs
         kwdefault_map: dict[str, Any] = {}
         for arg_node, default_value in zip(kwonlyargs, self.kw_defaults):
             if default_value is NO_DEFAULT:
@@ -313,6 +331,8 @@ class UserFunction:
             self.__annotations__,
         )
         self._private_owner = private_owner
+        # Mangled parameter names for call binding; built on the first call.
+        self._parameter_layout: tuple[Any, ...] | None = None
         _USER_FUNCTION_INTERPRETERS[self] = interpreter
 
     def __repr__(self) -> str:
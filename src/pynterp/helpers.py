@@ -5,10 +5,20 @@ import operator
 import sys
 from typing import Any, Callable, Dict, Iterator
 
-from .common import NO_DEFAULT, UNBOUND, AwaitRequest, ReturnSignal
-from .functions import UserFunction
+from .common import NO_DEFAULT, AwaitRequest, ReturnSignal
+from .functions import (
+    UserFunction,
+    _mangle_private_name_cached,
+    _mangle_private_name_for_owner,
+)
 from .lib.guards import safe_delattr, safe_getattr, safe_setattr
-from .scopes import ClassBodyScope, ComprehensionScope, FunctionScope, RuntimeScope
+from .scopes import (
+    SCOPE_CLASS,
+    SCOPE_COMPREHENSION,
+    SCOPE_FUNCTION,
+    FunctionScope,
+    RuntimeScope,
+)
 
 _PY_ANY = any
 _PY_HASATTR = hasattr
@@ -40,7 +50,8 @@ class InterpretedAsyncGenerator:
 
     @property
     def ag_frame(self) -> Any:
-        return getattr(self._body_runner, "gi_frame", None)
+        # The body runner is always a native generator, so gi_frame is present.
+        return self._body_runner.gi_frame
 
     @property
     def ag_code(self) -> Any:
@@ -138,14 +149,15 @@ class HelperMixin:
         if isinstance(base_scope, RuntimeScope):
             return self._qualname_prefix_for_scope(base_scope)
 
-        if isinstance(scope, ComprehensionScope):
+        kind = scope.SCOPE_KIND
+        if kind == SCOPE_COMPREHENSION:
             return self._qualname_prefix_for_scope(scope.outer_scope)
 
-        if isinstance(scope, ClassBodyScope):
+        if kind == SCOPE_CLASS:
             qualname = scope.class_ns.get("__qualname__", "")
             return qualname if isinstance(qualname, str) else ""
 
-        if isinstance(scope, FunctionScope) and scope.qualname:
+        if kind == SCOPE_FUNCTION and scope.qualname:
             return f"{scope.qualname}.<locals>"
 
         return ""
@@ -157,15 +169,10 @@ class HelperMixin:
         return f"{prefix}.{name}"
 
     def _mangle_private_name(self, name: str, scope: RuntimeScope) -> str:
-        owner = getattr(scope, "private_owner", None)
-        if not owner or not isinstance(name, str):
+        owner = scope.private_owner
+        if not owner or not _PY_ISINSTANCE(name, str):
             return name
-        if not name.startswith("__") or name.endswith("__") or "." in name:
-            return name
-        owner = owner.lstrip("_")
-        if not owner:
-            return name
-        return f"_{owner}{name}"
+        return _mangle_private_name_cached(name, owner)
 
     def _push_root_recursion_limit_state(self) -> bool:
         if _PY_SYS_GETFRAME is None:
@@ -555,6 +562,42 @@ class HelperMixin:
     # Function call binding + generator support
     # ----------------------------
 
+    def _parameter_layout(self, func_obj: UserFunction) -> tuple[Any, ...]:
+        """Return the function's mangled parameter names, computed once per function.
+
+        The tuple is `(params, params_set, posonly_names, kwonly_params,
+        kwonly_names, vararg_name, kwarg_name)`.
+        """
+        layout = func_obj._parameter_layout
+        if layout is None:
+            args = func_obj.node.args
+            owner = func_obj._private_owner
+            posonly = _PY_TUPLE(
+                _mangle_private_name_for_owner(a.arg, owner) for a in args.posonlyargs
+            )
+            params = posonly + _PY_TUPLE(
+                _mangle_private_name_for_owner(a.arg, owner) for a in args.args
+            )
+            kwonly = _PY_TUPLE(
+                _mangle_private_name_for_owner(a.arg, owner) for a in args.kwonlyargs
+            )
+            vararg_name = kwarg_name = None
+            if args.vararg is not None:
+                vararg_name = _mangle_private_name_for_owner(args.vararg.arg, owner)
+            if args.kwarg is not None:
+                kwarg_name = _mangle_private_name_for_owner(args.kwarg.arg, owner)
+            layout = (
+                params,
+                frozenset(params),
+                frozenset(posonly),
+                kwonly,
+                frozenset(kwonly),
+                vararg_name,
+                kwarg_name,
+            )
+            func_obj._parameter_layout = layout
+        return layout
+
     def _call_user_function(self, func_obj: UserFunction, args: tuple, kwargs: dict) -> Any:
         node = func_obj.node
         si = func_obj.scope_info
@@ -564,26 +607,24 @@ class HelperMixin:
             func_obj.globals,
             func_obj.builtins,
             si,
-            func_obj.closure,
+            func_obj.free_cells,
             qualname=func_obj.__qualname__,
             private_owner=func_obj._private_owner,
         )
         if _PY_HASATTR(self, "_call_stack") and self._call_stack:
             call_scope.active_exception = self._call_stack[-1][1].active_exception
 
-        def is_bound(name: str) -> bool:
-            if name in si.cellvars:
-                return call_scope.cells[name].value is not UNBOUND
-            return name in call_scope.locals
+        is_bound = call_scope.is_bound
 
-        posonly = getattr(node.args, "posonlyargs", []) or []
-        pos_or_kw = getattr(node.args, "args", []) or []
-        kwonlyargs = getattr(node.args, "kwonlyargs", []) or []
-        params_nodes = posonly + pos_or_kw
-        params = [self._mangle_private_name(a.arg, call_scope) for a in params_nodes]
-        params_set = set(params)
-        posonly_names = {self._mangle_private_name(a.arg, call_scope) for a in posonly}
-        kwonly_names = {self._mangle_private_name(a.arg, call_scope) for a in kwonlyargs}
+        (
+            params,
+            params_set,
+            posonly_names,
+            kwonly_params,
+            kwonly_names,
+            vararg_name,
+            kwarg_name,
+        ) = self._parameter_layout(func_obj)
 
         default_map: Dict[str, Any] = {}
         defaults_obj = getattr(func_obj, "__defaults__", None)
@@ -597,7 +638,7 @@ class HelperMixin:
                 default_map[name] = val
 
         # positional binding
-        if _PY_LEN(args) > _PY_LEN(params) and node.args.vararg is None:
+        if _PY_LEN(args) > _PY_LEN(params) and vararg_name is None:
             raise TypeError(
                 f"{func_name}() takes {_PY_LEN(params)} positional args but {_PY_LEN(args)} were given"
             )
@@ -607,18 +648,17 @@ class HelperMixin:
 
         extra_pos = args[_PY_LEN(params) :]
         if extra_pos:
-            if node.args.vararg is None:
+            if vararg_name is None:
                 raise TypeError("varargs not supported")
-            call_scope.store(node.args.vararg.arg, _PY_TUPLE(extra_pos))
+            call_scope.store(vararg_name, _PY_TUPLE(extra_pos))
 
         # keyword binding
         posonly_keywords: list[str] = []
         for k, v in kwargs.items():
             if k in posonly_names:
-                if node.args.kwarg is None:
+                if kwarg_name is None:
                     posonly_keywords.append(k)
                     continue
-                kwarg_name = node.args.kwarg.arg
                 if not is_bound(kwarg_name):
                     call_scope.store(kwarg_name, {})
                 d = call_scope.load(kwarg_name)
@@ -630,9 +670,8 @@ class HelperMixin:
                     raise TypeError(f"{func_name}() got multiple values for argument '{k}'")
                 call_scope.store(k, v)
             else:
-                if node.args.kwarg is None:
+                if kwarg_name is None:
                     raise TypeError(f"{func_name}() got unexpected keyword argument '{k}'")
-                kwarg_name = node.args.kwarg.arg
                 if not is_bound(kwarg_name):
                     call_scope.store(kwarg_name, {})
                 d = call_scope.load(kwarg_name)
@@ -659,9 +698,8 @@ class HelperMixin:
             kwdefault_map: dict[str, Any] = {}
         else:
             kwdefault_map = dict(kwdefaults)
-        if kwonlyargs:
-            for arg_node, default_val in _PY_ZIP(kwonlyargs, func_obj.kw_defaults):
-                name = self._mangle_private_name(arg_node.arg, call_scope)
+        if kwonly_params:
+            for name, default_val in _PY_ZIP(kwonly_params, func_obj.kw_defaults):
                 if name in kwdefault_map:
                     default_val = kwdefault_map[name]
                 if not is_bound(name):
@@ -673,10 +711,10 @@ class HelperMixin:
                         )
 
         # ensure vararg/kwarg exist
-        if node.args.vararg is not None and not is_bound(node.args.vararg.arg):
-            call_scope.store(node.args.vararg.arg, ())
-        if node.args.kwarg is not None and not is_bound(node.args.kwarg.arg):
-            call_scope.store(node.args.kwarg.arg, {})
+        if vararg_name is not None and not is_bound(vararg_name):
+            call_scope.store(vararg_name, ())
+        if kwarg_name is not None and not is_bound(kwarg_name):
+            call_scope.store(kwarg_name, {})
 
         if not _PY_HASATTR(self, "_call_stack"):
             self._call_stack = []
@@ -701,7 +739,7 @@ class HelperMixin:
                     pushed_root_state = enter_call_frame()
                     try:
                         try:
-                            yield from self.g_exec_block(node.body, call_scope)
+                            yield from self.g_exec_block_raising(node.body, call_scope)
                         except ReturnSignal:
                             return
                     finally:
@@ -712,7 +750,7 @@ class HelperMixin:
             async def async_runner():
                 pushed_root_state = enter_call_frame()
                 try:
-                    body_runner = self.g_exec_block(node.body, call_scope)
+                    body_runner = self.g_exec_block_raising(node.body, call_scope)
                     try:
                         yielded = _PY_NEXT(body_runner)
                     except StopIteration:
@@ -753,7 +791,7 @@ class HelperMixin:
                 try:
                     if _PY_ISINSTANCE(node, ast.Lambda):
                         return self.eval_expr(node.body, call_scope)
-                    self.exec_block(node.body, call_scope)
+                    self.exec_block_raising(node.body, call_scope)
                 except ReturnSignal as r:
                     return r.value
                 return None
@@ -765,7 +803,7 @@ class HelperMixin:
             pushed_root_state = enter_call_frame()
             try:
                 try:
-                    yield from self.g_exec_block(node.body, call_scope)
+                    yield from self.g_exec_block_raising(node.body, call_scope)
                 except ReturnSignal as r:
                     return r.value
             finally:
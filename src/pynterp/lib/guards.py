@@ -9,6 +9,8 @@ from typing import Any
 
 # Runtime internals and reflective dunders below are common pivot points for
 # sandbox escapes (e.g. recovering globals/builtins/importers).
+# Membership stays hash-based: str caches its own hash, while an identity scan
+# over interned names would miss equal names built at runtime.
 _BLOCKED_ATTR_NAMES = frozenset(
     {
         "__base__",
@@ -52,6 +54,9 @@ _BLOCKED_ATTR_NAMES = frozenset(
     }
 )
 
+_BLOCKED_ATTR_MESSAGE = "attribute access to %r is blocked in this environment"
+_BLOCKED_ATTR_MESSAGES = {name: _BLOCKED_ATTR_MESSAGE % (name,) for name in _BLOCKED_ATTR_NAMES}
+
 _MISSING = object()
 _RUNTIME_OWNED_OBJECTS: weakref.WeakSet[Any] = weakref.WeakSet()
 
@@ -70,6 +75,7 @@ _RUNTIME_INTERNAL_INSTANCE_ATTRS = {
             "closure",
             "code",
             "defaults",
+            "free_cells",
             "globals",
             "is_async",
             "is_async_generator",
@@ -85,6 +91,7 @@ _RUNTIME_INTERNAL_INSTANCE_ATTRS = {
             "closure",
             "code",
             "defaults",
+            "free_cells",
             "globals",
             "is_async",
             "is_async_generator",
@@ -283,17 +290,11 @@ def _guard_attr_name_for_object(obj: Any, name: Any) -> str:
     if normalized_name == "__func__" and _allows_func_attr(obj):
         return normalized_name
     if obj is not None and _blocks_host_annotation_runtime_attr(obj, normalized_name):
-        raise AttributeError(
-            f"attribute access to {normalized_name!r} is blocked in this environment"
-        )
+        raise AttributeError(_BLOCKED_ATTR_MESSAGE % (normalized_name,))
     if obj is not None and _blocks_runtime_internal_attr(obj, normalized_name):
-        raise AttributeError(
-            f"attribute access to {normalized_name!r} is blocked in this environment"
-        )
-    if is_blocked_attr(normalized_name):
-        raise AttributeError(
-            f"attribute access to {normalized_name!r} is blocked in this environment"
-        )
+        raise AttributeError(_BLOCKED_ATTR_MESSAGE % (normalized_name,))
+    if normalized_name in _BLOCKED_ATTR_NAMES:
+        raise AttributeError(_BLOCKED_ATTR_MESSAGES[normalized_name])
     return normalized_name
 
 
@@ -311,7 +312,10 @@ def safe_getattr(obj: Any, name: str, *default: Any) -> Any:
                 return default[0]
             raise
 
-        raw_is_bound = getattr(raw_getattribute, "__self__", _MISSING) is not _MISSING
+        # Resolve the binding once per wrapper: the wrapped callable is fixed, so
+        # its __self__/__objclass__ need not be re-read on every guarded call.
+        raw_self = getattr(raw_getattribute, "__self__", _MISSING)
+        raw_is_bound = raw_self is not _MISSING
         raw_objclass = getattr(raw_getattribute, "__objclass__", None)
         use_object_fallback = raw_objclass is object and not raw_is_bound
 
@@ -335,7 +339,7 @@ def safe_getattr(obj: Any, name: str, *default: Any) -> Any:
                 attr_name = kwarg_value
 
             if raw_is_bound:
-                target = getattr(raw_getattribute, "__self__", _MISSING)
+                target = raw_self
                 if attr_name is _MISSING and args:
                     attr_name = args[0]
             else:
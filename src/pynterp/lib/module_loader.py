@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import ast
+import os
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Callable
 
 from .builtins import make_safe_builtins
 
+# path -> (mtime_ns, source, parsed tree). Shared across loaders so repeated
+# imports of an unchanged file skip both the read and the parse; an edited file
+# replaces its entry, so the cache holds at most one version per path.
+_SOURCE_CACHE: dict[str, tuple[int, str, ast.Module]] = {}
+
+
+def _read_module_source(module_path: Path) -> tuple[str, ast.Module]:
+    path_str = str(module_path)
+    mtime_ns = module_path.stat().st_mtime_ns
+    cached = _SOURCE_CACHE.get(path_str)
+    if cached is None or cached[0] != mtime_ns:
+        source = module_path.read_text()
+        cached = (mtime_ns, source, ast.parse(source, filename=path_str, mode="exec"))
+        _SOURCE_CACHE[path_str] = cached
+    return cached[1], cached[2]
+
 
 class InterpretedModuleLoader:
     """Import hook that executes package modules through an Interpreter instance."""
@@ -22,11 +40,24 @@ class InterpretedModuleLoader:
         self.package_name = package_name
         self.package_root = Path(package_root)
         self.fallback_importer = fallback_importer
+        # Plain-string copies for _module_path(), which probes the filesystem on
+        # every package import and should not allocate intermediate Path objects.
+        self._package_root_str = os.fspath(self.package_root)
+        self._package_name_len = len(package_name) + 1
 
         self.modules: dict[str, ModuleType] = {}
         self.builtins = make_safe_builtins(self.import_module)
 
     def import_module(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if not level and not fromlist:
+            # Plain absolute `import a.b.c`: no name resolution or fromlist work.
+            if not self._is_package_module(name):
+                return self.fallback_importer(name, globals, locals, fromlist, 0)
+            module = self._load_module(name)
+            if name == self.package_name:
+                return module
+            return self._load_module(self.package_name)
+
         absolute_name = self._resolve_absolute_name(name, globals, level)
 
         if self._is_package_module(absolute_name):
@@ -84,18 +115,19 @@ class InterpretedModuleLoader:
         return name == self.package_name or name.startswith(f"{self.package_name}.")
 
     def _module_path(self, module_name: str) -> Path | None:
+        root = self._package_root_str
         if module_name == self.package_name:
-            package_init = self.package_root / "__init__.py"
-            return package_init if package_init.exists() else None
+            package_init = os.path.join(root, "__init__.py")
+            return Path(package_init) if os.path.isfile(package_init) else None
 
-        relative = module_name[len(self.package_name) + 1 :].replace(".", "/")
-        module_file = self.package_root / f"{relative}.py"
-        if module_file.exists():
-            return module_file
+        relative = module_name[self._package_name_len :].replace(".", os.sep)
+        module_file = os.path.join(root, relative + ".py")
+        if os.path.isfile(module_file):
+            return Path(module_file)
 
-        package_init = self.package_root / relative / "__init__.py"
-        if package_init.exists():
-            return package_init
+        package_init = os.path.join(root, relative, "__init__.py")
+        if os.path.isfile(package_init):
+            return Path(package_init)
 
         return None
 
@@ -123,8 +155,10 @@ class InterpretedModuleLoader:
         self.modules[module_name] = module
 
         try:
-            source = module_path.read_text()
-            self.interpreter.run_or_raise(source, env=module_dict, filename=str(module_path))
+            source, tree = _read_module_source(module_path)
+            self.interpreter.run_or_raise(
+                source, env=module_dict, filename=str(module_path), tree=tree
+            )
         except BaseException:
             self.modules.pop(module_name, None)
             raise
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Dict, MutableMapping, Set
-
-from .code import ModuleCode, ScopeInfo
+from typing import Any, Dict, List, MutableMapping, Sequence, Set
+
+from .code import (
+    NAME_CELL,
+    NAME_FREE,
+    NAME_GLOBAL,
+    NAME_IMPLICIT,
+    NAME_LOCAL,
+    ModuleCode,
+    ScopeInfo,
+)
 from .common import UNBOUND, Cell
 
+_PY_LEN = len
 _MISSING = object()
+_IMPLICIT_SLOT = (NAME_IMPLICIT, -1)
+
+
+# RuntimeScope.SCOPE_KIND tags, compared instead of isinstance() on hot paths.
+# Proxy scopes (e.g. type-alias evaluation) keep the SCOPE_OTHER default.
+SCOPE_OTHER = -1
+SCOPE_MODULE = 0
+SCOPE_FUNCTION = 1
+SCOPE_CLASS = 2
+SCOPE_COMPREHENSION = 3
 
 
 class RuntimeScope:
+    # A scope is allocated per call/class body/comprehension; slots keep that
+    # allocation to a fixed layout with no per-instance __dict__.
+    __slots__ = ("code", "globals", "builtins", "active_exception", "private_owner")
+    SCOPE_KIND = SCOPE_OTHER
+
     def __init__(
         self,
         code: ModuleCode,
@@ -42,11 +66,19 @@ class RuntimeScope:
 
 
 class ModuleScope(RuntimeScope):
+    __slots__ = ()
+    SCOPE_KIND = SCOPE_MODULE
+
     def load(self, name: str) -> Any:
-        if name in self.globals:
-            return self.globals[name]
-        if name in self.builtins:
-            return self.builtins[name]
+        # One probe per namespace: a sentinel-default get() replaces `in` + `[]`.
+        # (dict version tags are not observable from Python, so a cross-call
+        # inline cache could not be invalidated on writes made via globals().)
+        value = self.globals.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self.builtins.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         raise NameError(name)
 
     def store(self, name: str, value: Any) -> Any:
@@ -57,23 +89,24 @@ class ModuleScope(RuntimeScope):
         self.globals.pop(name, None)
 
     def delete(self, name: str) -> None:
-        if name in self.globals:
-            del self.globals[name]
-            return
-        raise NameError(name)
+        if self.globals.pop(name, _MISSING) is _MISSING:
+            raise NameError(name)
 
     def capture_cell(self, name: str) -> Cell:
         raise NameError(f"cannot capture free variable {name!r} from module scope")
 
 
 class FunctionScope(RuntimeScope):
+    __slots__ = ("scope_info", "free_cells", "qualname", "locals", "cells", "unlisted_locals")
+    SCOPE_KIND = SCOPE_FUNCTION
+
     def __init__(
         self,
         code: ModuleCode,
         globals_dict: dict,
         builtins_dict: dict,
         scope_info: ScopeInfo,
-        closure: Dict[str, Cell],
+        free_cells: Sequence[Cell | None],
         *,
         qualname: str | None = None,
         private_owner: str | None = None,
@@ -85,40 +118,63 @@ class FunctionScope(RuntimeScope):
             private_owner=private_owner,
         )
         self.scope_info = scope_info
-        self.closure = dict(closure)
+        # Closure cells indexed by ScopeInfo free-var index (None when the
+        # defining scope could not supply one). Held by reference: the
+        # owning UserFunction never mutates it.
+        self.free_cells = free_cells
         self.qualname = qualname
 
-        # locals maps name -> value OR Cell
-        self.locals: Dict[str, Any] = {}
-        self.cells: Dict[str, Cell] = {}
-
-        # pre-create cells for cellvars
-        for name in scope_info.cellvars:
-            cell = Cell(UNBOUND)
-            self.cells[name] = cell
-            self.locals[name] = cell
+        # Fast locals: one slot per ScopeInfo.local_indices entry, holding a
+        # value or UNBOUND. Cellvars live only in `cells`, indexed by
+        # ScopeInfo.cell_indices.
+        self.locals: List[Any] = [UNBOUND] * scope_info.num_locals
+        cell_indices = scope_info.cell_indices
+        self.cells: Sequence[Cell] = [Cell(UNBOUND) for _ in cell_indices] if cell_indices else ()
+        # Names the symtable does not list as locals of this function; only
+        # reachable through interpreter-internal stores.
+        self.unlisted_locals: Dict[str, Any] | None = None
+
+    # Raw slot reads, named after the CPython opcodes they mirror, for callers
+    # that already hold a ScopeInfo slot and want UNBOUND back instead of an
+    # error (e.g. locals()). load()/store() stay the name-based entry points.
+
+    def load_fast(self, index: int) -> Any:
+        """Return the raw fast-locals slot at `index` (a value or UNBOUND)."""
+        return self.locals[index]
+
+    def load_deref(self, index: int) -> Any:
+        """Return the raw value of the cellvar at `index` (a value or UNBOUND)."""
+        return self.cells[index].value
+
+    def is_bound(self, name: str) -> bool:
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
+        if kind == NAME_LOCAL:
+            return self.locals[index] is not UNBOUND
+        if kind == NAME_CELL:
+            return self.cells[index].value is not UNBOUND
+        unlisted = self.unlisted_locals
+        return unlisted is not None and name in unlisted
 
     def load(self, name: str) -> Any:
-        si = self.scope_info
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
 
         # Local (fast/local slot)
-        if name in si.locals:
-            if name in self.locals:
-                val = self.locals[name]
-                # Avoid isinstance() here: user-defined __getattribute__ on
-                # interpreted objects can recurse when Python probes __class__.
-                if type(val) is Cell:
-                    if val.value is UNBOUND:
-                        raise UnboundLocalError(
-                            f"local variable '{name}' referenced before assignment"
-                        )
-                    return val.value
-                return val
-            raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+        if kind == NAME_LOCAL:
+            val = self.locals[index]
+            if val is UNBOUND:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            return val
+
+        # Cellvar
+        if kind == NAME_CELL:
+            val = self.cells[index].value
+            if val is UNBOUND:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            return val
 
         # Free var (closure)
-        if name in si.frees:
-            cell = self.closure.get(name)
+        if kind == NAME_FREE:
+            cell = self.free_cells[index]
             if cell is None:
                 raise NameError(f"free variable '{name}' is not available in closure")
             if cell.value is UNBOUND:
@@ -129,92 +185,100 @@ class FunctionScope(RuntimeScope):
             return cell.value
 
         # Global / builtins
-        if name in self.globals:
-            return self.globals[name]
-        if name in self.builtins:
-            return self.builtins[name]
+        value = self.globals.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self.builtins.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         raise NameError(name)
 
     def store(self, name: str, value: Any) -> Any:
-        si = self.scope_info
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
+
+        # regular local
+        if kind == NAME_LOCAL:
+            self.locals[index] = value
+            return value
+
+        # cellvar
+        if kind == NAME_CELL:
+            self.cells[index].value = value
+            return value
 
         # global statement
-        if name in si.declared_globals:
+        if kind == NAME_GLOBAL:
             self.globals[name] = value
             return value
 
         # nonlocal / free
-        if name in si.frees:
-            cell = self.closure.get(name)
+        if kind == NAME_FREE:
+            cell = self.free_cells[index]
             if cell is None:
                 raise NameError(f"cannot assign to free variable '{name}' (missing closure cell)")
             cell.value = value
             return value
 
-        # cellvar
-        if name in si.cellvars:
-            self.cells[name].value = value
-            return value
-
-        # regular local
-        self.locals[name] = value
+        unlisted = self.unlisted_locals
+        if unlisted is None:
+            unlisted = self.unlisted_locals = {}
+        unlisted[name] = value
         return value
 
     def unbind(self, name: str) -> None:
-        si = self.scope_info
-        if name in si.declared_globals:
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
+        if kind == NAME_LOCAL:
+            self.locals[index] = UNBOUND
+            return
+        if kind == NAME_CELL:
+            self.cells[index].value = UNBOUND
+            return
+        if kind == NAME_GLOBAL:
             self.globals.pop(name, None)
             return
-        if name in si.frees:
-            cell = self.closure.get(name)
+        if kind == NAME_FREE:
+            cell = self.free_cells[index]
             if cell is not None:
                 cell.value = UNBOUND
             return
-        if name in si.cellvars:
-            self.cells[name].value = UNBOUND
-            return
-        self.locals.pop(name, None)
+        unlisted = self.unlisted_locals
+        if unlisted is not None:
+            unlisted.pop(name, None)
 
     def delete(self, name: str) -> None:
-        si = self.scope_info
-
-        if name in si.declared_globals:
-            if name in self.globals:
-                del self.globals[name]
-                return
-            raise NameError(name)
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
 
-        if name in si.frees:
-            cell = self.closure.get(name)
-            if cell is None or cell.value is UNBOUND:
-                raise NameError(name)
-            cell.value = UNBOUND
+        if kind == NAME_LOCAL:
+            locals_ = self.locals
+            if locals_[index] is UNBOUND:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            locals_[index] = UNBOUND
             return
 
-        # local
-        if name in si.locals:
-            if name in si.cellvars:
-                if self.cells[name].value is UNBOUND:
-                    raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
-                self.cells[name].value = UNBOUND
-                return
-            if name not in self.locals:
+        if kind == NAME_CELL:
+            cell = self.cells[index]
+            if cell.value is UNBOUND:
                 raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
-            del self.locals[name]
+            cell.value = UNBOUND
             return
 
-        # maybe global fallback
-        if name in self.globals:
-            del self.globals[name]
+        if kind == NAME_FREE:
+            cell = self.free_cells[index]
+            if cell is None or cell.value is UNBOUND:
+                raise NameError(name)
+            cell.value = UNBOUND
             return
-        raise NameError(name)
+
+        # declared global, or implicit global fallback
+        if self.globals.pop(name, _MISSING) is _MISSING:
+            raise NameError(name)
 
     def capture_cell(self, name: str) -> Cell:
-        si = self.scope_info
-        if name in si.cellvars:
-            return self.cells[name]
-        if name in si.frees:
-            cell = self.closure.get(name)
+        kind, index = self.scope_info.slots.get(name, _IMPLICIT_SLOT)
+        if kind == NAME_CELL:
+            return self.cells[index]
+        if kind == NAME_FREE:
+            cell = self.free_cells[index]
             if cell is None:
                 raise NameError(f"free variable '{name}' is not available for capture")
             return cell
@@ -232,6 +296,18 @@ class ClassBodyScope(RuntimeScope):
         (matches CPython behavior: methods don't close over class locals)
     """
 
+    __slots__ = (
+        "outer_scope",
+        "class_ns",
+        "class_cell",
+        "type_param_cells",
+        "_has_type_params",
+        "_shadowed_type_param_names",
+        "_enclosing_type_param_cells",
+        "_root_outer_scope",
+    )
+    SCOPE_KIND = SCOPE_CLASS
+
     def __init__(
         self,
         code: ModuleCode,
@@ -253,10 +329,24 @@ class ClassBodyScope(RuntimeScope):
         self.class_ns = class_ns
         self.class_cell = class_cell
         self.type_param_cells = dict(type_param_cells or {})
+        # Most classes are not generic; lets load/store skip type-param work.
+        self._has_type_params = bool(self.type_param_cells)
         self._shadowed_type_param_names: Set[str] = set()
+        # Enclosing class bodies are skipped for name resolution except for
+        # their type params, so flatten the chain once: every type param
+        # visible from here (inner wins) plus the first non-class scope.
+        if outer_scope.SCOPE_KIND == SCOPE_CLASS:
+            enclosing = dict(outer_scope._enclosing_type_param_cells)
+            enclosing.update(self.type_param_cells)
+            self._enclosing_type_param_cells: Dict[str, Cell] = enclosing
+            self._root_outer_scope: RuntimeScope = outer_scope._root_outer_scope
+        else:
+            self._enclosing_type_param_cells = self.type_param_cells
+            self._root_outer_scope = outer_scope
 
     def _load_type_param(self, name: str, *, honor_shadowing: bool) -> Any:
-        if honor_shadowing and name in self._shadowed_type_param_names:
+        shadowed = self._shadowed_type_param_names
+        if honor_shadowing and shadowed and name in shadowed:
             return _MISSING
         type_param_cell = self.type_param_cells.get(name)
         if type_param_cell is None:
@@ -266,44 +356,61 @@ class ClassBodyScope(RuntimeScope):
         return type_param_cell.value
 
     def _load_from_enclosing(self, name: str) -> Any:
-        value = self._load_type_param(name, honor_shadowing=False)
-        if value is not _MISSING:
-            return value
-        if isinstance(self.outer_scope, ClassBodyScope):
-            return self.outer_scope._load_from_enclosing(name)
-        return self.outer_scope.load(name)
+        type_param_cell = self._enclosing_type_param_cells.get(name)
+        if type_param_cell is None:
+            return self._root_outer_scope.load(name)
+        if type_param_cell.value is UNBOUND:
+            raise NameError(name)
+        return type_param_cell.value
 
     def load(self, name: str) -> Any:
-        if name in self.class_ns:
-            return self.class_ns[name]
-        value = self._load_type_param(name, honor_shadowing=True)
-        if value is not _MISSING:
-            return value
-        if isinstance(self.outer_scope, ClassBodyScope):
-            return self.outer_scope._load_from_enclosing(name)
-        return self.outer_scope.load(name)
+        class_ns = self.class_ns
+        if type(class_ns) is dict:
+            value = class_ns.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif name in class_ns:
+            # __prepare__ namespaces may override __contains__/__getitem__.
+            return class_ns[name]
+        if self._has_type_params:
+            value = self._load_type_param(name, honor_shadowing=True)
+            if value is not _MISSING:
+                return value
+        outer_scope = self.outer_scope
+        if outer_scope is self._root_outer_scope:
+            return outer_scope.load(name)
+        return outer_scope._load_from_enclosing(name)
 
     def store(self, name: str, value: Any) -> Any:
         self.class_ns[name] = value
-        if name in self.type_param_cells:
+        if self._has_type_params and name in self.type_param_cells:
             # Class-local rebinding shadows generic type params for direct loads
             # in the class body, but closures still capture the type-param cell.
             self._shadowed_type_param_names.add(name)
         return value
 
     def unbind(self, name: str) -> None:
-        if name in self.class_ns:
-            del self.class_ns[name]
+        class_ns = self.class_ns
+        if type(class_ns) is dict:
+            class_ns.pop(name, None)
+        elif name in class_ns:
+            del class_ns[name]
 
     def delete(self, name: str) -> None:
-        if name in self.class_ns:
-            del self.class_ns[name]
+        class_ns = self.class_ns
+        if type(class_ns) is dict:
+            if class_ns.pop(name, _MISSING) is _MISSING:
+                raise NameError(name)
+            return
+        if name in class_ns:
+            del class_ns[name]
             return
         raise NameError(name)
 
     def capture_cell(self, name: str) -> Cell:
-        if name == "__class__" and self.class_cell is not None:
-            return self.class_cell
+        class_cell = self.class_cell
+        if name == "__class__" and class_cell is not None:
+            return class_cell
         type_param_cell = self.type_param_cells.get(name)
         if type_param_cell is not None:
             return type_param_cell
@@ -318,6 +425,24 @@ class ComprehensionScope(RuntimeScope):
     while loads fall back to the outer scope.
     """
 
+    __slots__ = ("outer_scope", "local_names", "locals")
+    SCOPE_KIND = SCOPE_COMPREHENSION
+
+    @staticmethod
+    def for_targets(
+        code: ModuleCode,
+        globals_dict: dict,
+        builtins_dict: dict,
+        outer_scope: RuntimeScope,
+        local_names: Set[str],
+    ) -> ComprehensionScope:
+        """Build the comprehension scope, specialized for a single target name."""
+        if _PY_LEN(local_names) == 1:
+            return SingleLocalComprehensionScope(
+                code, globals_dict, builtins_dict, outer_scope, local_names
+            )
+        return ComprehensionScope(code, globals_dict, builtins_dict, outer_scope, local_names)
+
     def __init__(
         self,
         code: ModuleCode,
@@ -330,16 +455,25 @@ class ComprehensionScope(RuntimeScope):
             code,
             globals_dict,
             builtins_dict,
-            private_owner=getattr(outer_scope, "private_owner", None),
+            private_owner=outer_scope.private_owner,
         )
         self.outer_scope = outer_scope
         self.local_names = set(local_names)
         self.locals: Dict[str, Any] = {}
-        self.cells: Dict[str, Cell] = {}
+
+    def bound_locals(self) -> Dict[str, Any]:
+        """Snapshot of the bound comprehension locals, as locals() reports them."""
+        bound: Dict[str, Any] = {}
+        for name, val in self.locals.items():
+            if type(val) is Cell:
+                val = val.value
+            if val is not UNBOUND:
+                bound[name] = val
+        return bound
 
     def load(self, name: str) -> Any:
-        if name in self.locals:
-            val = self.locals[name]
+        val = self.locals.get(name, _MISSING)
+        if val is not _MISSING:
             if type(val) is Cell:
                 if val.value is UNBOUND:
                     raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
@@ -352,29 +486,32 @@ class ComprehensionScope(RuntimeScope):
         return self.outer_scope.load(name)
 
     def store(self, name: str, value: Any) -> Any:
-        existing = self.locals.get(name, _MISSING)
+        locals_ = self.locals
+        existing = locals_.get(name, _MISSING)
         if type(existing) is Cell:
             existing.value = value
             return value
-        self.locals[name] = value
+        locals_[name] = value
         return value
 
     def unbind(self, name: str) -> None:
-        existing = self.locals.get(name, _MISSING)
+        locals_ = self.locals
+        existing = locals_.get(name, _MISSING)
         if type(existing) is Cell:
             existing.value = UNBOUND
             return
-        self.locals.pop(name, None)
+        locals_.pop(name, None)
 
     def delete(self, name: str) -> None:
-        if name in self.locals:
-            existing = self.locals[name]
+        locals_ = self.locals
+        existing = locals_.get(name, _MISSING)
+        if existing is not _MISSING:
             if type(existing) is Cell:
                 if existing.value is UNBOUND:
                     raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
                 existing.value = UNBOUND
             else:
-                del self.locals[name]
+                del locals_[name]
             return
         if name in self.local_names:
             raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
@@ -382,12 +519,124 @@ class ComprehensionScope(RuntimeScope):
 
     def capture_cell(self, name: str) -> Cell:
         if name in self.local_names:
-            existing = self.locals.get(name, _MISSING)
+            locals_ = self.locals
+            existing = locals_.get(name, _MISSING)
             if type(existing) is Cell:
                 return existing
 
             cell = Cell(UNBOUND if existing is _MISSING else existing)
-            self.locals[name] = cell
-            self.cells[name] = cell
+            locals_[name] = cell
             return cell
         return self.outer_scope.capture_cell(name)
+
+
+# Never written: SingleLocalComprehensionScope swaps in a real dict first.
+_NO_COMPREHENSION_LOCALS: Dict[str, Any] = {}
+
+
+class SingleLocalComprehensionScope(ComprehensionScope):
+    """
+    ComprehensionScope for the common one-target shape (`[f(x) for x in xs]`).
+
+    The target lives in a single slot (a value, UNBOUND, or its Cell once a
+    nested lambda captures it) and is matched by identity first, since parser
+    identifiers are interned. Any other name stored here takes the generic
+    dict path.
+    """
+
+    __slots__ = ("_local_name", "_local_value")
+
+    def __init__(
+        self,
+        code: ModuleCode,
+        globals_dict: dict,
+        builtins_dict: dict,
+        outer_scope: RuntimeScope,
+        local_names: Set[str],
+    ):
+        # Skip ComprehensionScope.__init__: the caller's fresh name set is only
+        # read, and the generic locals dict starts as a shared empty one that
+        # store() replaces before any other name is written.
+        RuntimeScope.__init__(
+            self,
+            code,
+            globals_dict,
+            builtins_dict,
+            private_owner=outer_scope.private_owner,
+        )
+        self.outer_scope = outer_scope
+        self.local_names = local_names
+        self.locals = _NO_COMPREHENSION_LOCALS
+        (self._local_name,) = local_names
+        self._local_value: Any = UNBOUND
+
+    def bound_locals(self) -> Dict[str, Any]:
+        bound = super().bound_locals()
+        val = self._local_value
+        if type(val) is Cell:
+            val = val.value
+        if val is not UNBOUND:
+            bound[self._local_name] = val
+        return bound
+
+    def load(self, name: str) -> Any:
+        local_name = self._local_name
+        if name is local_name or name == local_name:
+            val = self._local_value
+            if type(val) is Cell:
+                val = val.value
+            if val is UNBOUND:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            return val
+        if self.locals:
+            return super().load(name)
+        return self.outer_scope.load(name)
+
+    def store(self, name: str, value: Any) -> Any:
+        local_name = self._local_name
+        if name is local_name or name == local_name:
+            existing = self._local_value
+            if type(existing) is Cell:
+                existing.value = value
+            else:
+                self._local_value = value
+            return value
+        if self.locals is _NO_COMPREHENSION_LOCALS:
+            self.locals = {}
+        return super().store(name, value)
+
+    def unbind(self, name: str) -> None:
+        local_name = self._local_name
+        if name is local_name or name == local_name:
+            existing = self._local_value
+            if type(existing) is Cell:
+                existing.value = UNBOUND
+            else:
+                self._local_value = UNBOUND
+            return
+        super().unbind(name)
+
+    def delete(self, name: str) -> None:
+        local_name = self._local_name
+        if name is local_name or name == local_name:
+            existing = self._local_value
+            if type(existing) is Cell:
+                if existing.value is UNBOUND:
+                    raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+                existing.value = UNBOUND
+                return
+            if existing is UNBOUND:
+                raise UnboundLocalError(f"local variable '{name}' referenced before assignment")
+            self._local_value = UNBOUND
+            return
+        super().delete(name)
+
+    def capture_cell(self, name: str) -> Cell:
+        local_name = self._local_name
+        if name is local_name or name == local_name:
+            existing = self._local_value
+            if type(existing) is Cell:
+                return existing
+            cell = self._local_value = Cell(existing)
+            return cell
+        return super().capture_cell(name)
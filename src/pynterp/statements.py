@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import ast
 import builtins as py_builtins
+import functools
 import types as py_types
 import typing as py_typing
 from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any, Dict, Iterator
 
+from .code import NAME_LOCAL
 from .common import (
     NO_DEFAULT,
+    STATUS_BREAK,
+    STATUS_CONTINUE,
     UNBOUND,
     AwaitRequest,
     BreakSignal,
@@ -17,76 +21,140 @@ from .common import (
     ControlFlowSignal,
     ReturnSignal,
 )
-from .functions import UserFunction
+from .functions import UserFunction, _mangle_private_name_for_owner
 from .host_exec import safe_host_eval, safe_host_exec
 from .lib.guards import mark_runtime_owned, safe_getattr
-from .scopes import ClassBodyScope, FunctionScope, RuntimeScope
-from .symtable_utils import _contains_yield
+from .scopes import SCOPE_CLASS, SCOPE_FUNCTION, ClassBodyScope, RuntimeScope
 
 _MISSING = object()
-_BUILTIN_MATCH_SELF_TYPES = (
-    bool,
-    bytearray,
-    bytes,
-    dict,
-    float,
-    frozenset,
-    int,
-    list,
-    set,
-    str,
-    tuple,
+# Compiled once; typing factories are evaluated under interpreted globals on
+# every TypeVar/ParamSpec/TypeVarTuple/TypeAliasType construction.
+_TYPING_RUNTIME_CALL_CODE = compile(
+    "__pynterp_factory(*__pynterp_args, **__pynterp_kwargs)", "<pynterp-typing>", "eval"
 )
+_BUILTIN_MATCH_SELF_TYPES = frozenset(
+    {
+        bool,
+        bytearray,
+        bytes,
+        dict,
+        float,
+        frozenset,
+        int,
+        list,
+        set,
+        str,
+        tuple,
+    }
+)
+
+
+def _lookup_special(cls: type, name: str) -> Any:
+    # Type-only lookup with no descriptor binding, like CPython's special-method lookup.
+    for klass in cls.__mro__:
+        attrs = klass.__dict__
+        if name in attrs:
+            return attrs[name]
+    return _MISSING
+
+
+def _bind_special(attr: Any, obj: Any, cls: type) -> Any:
+    get = getattr(type(attr), "__get__", None)
+    if get is None:
+        return attr
+    return get(attr, obj, cls)
+
+
+@functools.lru_cache(maxsize=256)
+def _lazy_typevar_factory_code(
+    name: str, has_bound: bool, constraint_count: int, has_default: bool
+) -> Any:
+    # Host syntax builds the lazily evaluated TypeVar; the generated source only
+    # depends on the parameter's shape, so compile it once per shape.
+    params: list[str] = []
+    annotation = ""
+    if has_bound:
+        params.append("__pynterp_eval_bound")
+        annotation = ": __pynterp_eval_bound()"
+    elif constraint_count:
+        callback_names = []
+        for index in range(constraint_count):
+            callback_name = f"__pynterp_eval_constraint_{index}"
+            params.append(callback_name)
+            callback_names.append(f"{callback_name}()")
+        tuple_expr = ", ".join(callback_names)
+        if constraint_count == 1:
+            tuple_expr += ","
+        annotation = f": ({tuple_expr})"
+
+    default_expr = ""
+    if has_default:
+        params.append("__pynterp_eval_default")
+        default_expr = " = __pynterp_eval_default()"
+
+    param_list = ", ".join(params)
+    source = (
+        f"def __pynterp_make_typevar({param_list}):\n"
+        f"    def __pynterp_tmp[{name}{annotation}{default_expr}]():\n"
+        "        pass\n"
+        "    return __pynterp_tmp.__type_params__[0]\n"
+    )
+    return compile(source, "<string>", "exec")
 
 
 class _TypeAliasEvalScope(RuntimeScope):
+    __slots__ = ("_base_scope", "_type_param_bindings", "_type_param_cells")
+
     def __init__(self, base_scope: RuntimeScope, type_param_bindings: Dict[str, Any]):
         super().__init__(
             base_scope.code,
             base_scope.globals,
             base_scope.builtins,
-            private_owner=getattr(base_scope, "private_owner", None),
+            private_owner=base_scope.private_owner,
         )
         self._base_scope = base_scope
         self._type_param_bindings = type_param_bindings
         self._type_param_cells = {name: Cell(value) for name, value in type_param_bindings.items()}
 
+    # Most names resolved here are globals/builtins, so each method tests
+    # membership first; a dict `in` miss is cheaper than a .get() call.
     def load(self, name: str) -> Any:
-        type_param_cell = self._type_param_cells.get(name)
-        if type_param_cell is not None:
-            if type_param_cell.value is UNBOUND:
+        type_param_cells = self._type_param_cells
+        if name in type_param_cells:
+            value = type_param_cells[name].value
+            if value is UNBOUND:
                 raise NameError(name)
-            return type_param_cell.value
+            return value
         return self._base_scope.load(name)
 
     def store(self, name: str, value: Any) -> Any:
-        type_param_cell = self._type_param_cells.get(name)
-        if type_param_cell is not None:
-            type_param_cell.value = value
+        type_param_cells = self._type_param_cells
+        if name in type_param_cells:
+            type_param_cells[name].value = value
             self._type_param_bindings[name] = value
             return value
         return self._base_scope.store(name, value)
 
     def unbind(self, name: str) -> None:
-        type_param_cell = self._type_param_cells.get(name)
-        if type_param_cell is not None:
-            type_param_cell.value = UNBOUND
+        type_param_cells = self._type_param_cells
+        if name in type_param_cells:
+            type_param_cells[name].value = UNBOUND
             self._type_param_bindings.pop(name, None)
             return
         self._base_scope.unbind(name)
 
     def delete(self, name: str) -> None:
-        type_param_cell = self._type_param_cells.get(name)
-        if type_param_cell is not None:
-            type_param_cell.value = UNBOUND
+        type_param_cells = self._type_param_cells
+        if name in type_param_cells:
+            type_param_cells[name].value = UNBOUND
             self._type_param_bindings.pop(name, None)
             return
         self._base_scope.delete(name)
 
     def capture_cell(self, name: str) -> Cell:
-        type_param_cell = self._type_param_cells.get(name)
-        if type_param_cell is not None:
-            return type_param_cell
+        type_param_cells = self._type_param_cells
+        if name in type_param_cells:
+            return type_param_cells[name]
         return self._base_scope.capture_cell(name)
 
 
@@ -99,28 +167,27 @@ class _AsyncForAwaitable:
 
 
 class StatementMixin:
+    # Bound per instance by InterpreterCore, so subclasses can override a matcher.
+    # ast.Match* classes are never subclassed, so exact-class lookup suffices.
+    _MATCH_PATTERN_HANDLER_NAMES = (
+        (ast.MatchValue, "_match_value_pattern"),
+        (ast.MatchSingleton, "_match_singleton_pattern"),
+        (ast.MatchSequence, "_match_sequence_pattern"),
+        (ast.MatchMapping, "_match_mapping_pattern"),
+        (ast.MatchClass, "_match_class_pattern"),
+        (ast.MatchAs, "_match_as_pattern"),
+        (ast.MatchOr, "_match_or_pattern"),
+    )
+
     def _store_definition_name(self, scope: RuntimeScope, name: str, value: Any) -> None:
         scope.store(
-            self._mangle_private_name_for_owner(name, getattr(scope, "private_owner", None)),
+            _mangle_private_name_for_owner(name, scope.private_owner),
             value,
         )
 
-    def _mangle_private_name_for_owner(self, name: str, private_owner: str | None) -> str:
-        if not private_owner or not isinstance(name, str):
-            return name
-        if not name.startswith("__") or name.endswith("__") or "." in name:
-            return name
-        owner = private_owner.lstrip("_")
-        if not owner:
-            return name
-        return f"_{owner}{name}"
-
     def _type_param_binding_names(self, name: str, *, private_owner: str | None) -> tuple[str, ...]:
-        names = [name]
-        mangled_name = self._mangle_private_name_for_owner(name, private_owner)
-        if mangled_name != name:
-            names.append(mangled_name)
-        return tuple(names)
+        mangled_name = _mangle_private_name_for_owner(name, private_owner)
+        return (name,) if mangled_name is name else (name, mangled_name)
 
     def _build_type_param_binding_map(
         self,
@@ -156,16 +223,16 @@ class StatementMixin:
         return cells
 
     def _new_provisional_type_param(self, node: ast.AST, scope: RuntimeScope) -> Any:
-        if isinstance(node, ast.TypeVar):
+        if node.__class__ is ast.TypeVar:
             return self._typing_runtime_call(scope, py_typing.TypeVar, node.name)
-        if isinstance(node, ast.ParamSpec):
+        if node.__class__ is ast.ParamSpec:
             return self._typing_runtime_call(scope, py_typing.ParamSpec, node.name)
-        if isinstance(node, ast.TypeVarTuple):
+        if node.__class__ is ast.TypeVarTuple:
             return self._typing_runtime_call(scope, py_typing.TypeVarTuple, node.name)
         raise NotImplementedError(f"Type parameter not supported: {node.__class__.__name__}")
 
     def _eval_type_param_default(self, node: ast.expr, scope: RuntimeScope) -> Any:
-        if isinstance(node, ast.Starred):
+        if node.__class__ is ast.Starred:
             # Match compiler semantics for type-parameter defaults like `*Ts = *default`.
             (value,) = self.eval_expr(node.value, scope)
             return value
@@ -176,7 +243,7 @@ class StatementMixin:
     ) -> Any:
         # Run typing factories under interpreted globals so `__module__` matches the interpreted module.
         return safe_host_eval(
-            "__pynterp_factory(*__pynterp_args, **__pynterp_kwargs)",
+            _TYPING_RUNTIME_CALL_CODE,
             scope.globals,
             scope.builtins,
             {
@@ -192,7 +259,7 @@ class StatementMixin:
     ) -> tuple[Any, ...]:
         bases: list[Any] = []
         for base_node in base_nodes:
-            if isinstance(base_node, ast.Starred):
+            if base_node.__class__ is ast.Starred:
                 bases.extend(self.eval_expr(base_node.value, scope))
             else:
                 bases.append(self.eval_expr(base_node, scope))
@@ -203,7 +270,7 @@ class StatementMixin:
     ) -> Iterator[tuple[Any, ...]]:
         bases: list[Any] = []
         for base_node in base_nodes:
-            if isinstance(base_node, ast.Starred):
+            if base_node.__class__ is ast.Starred:
                 bases.extend((yield from self.g_eval_expr(base_node.value, scope)))
             else:
                 bases.append((yield from self.g_eval_expr(base_node, scope)))
@@ -266,8 +333,12 @@ class StatementMixin:
     def _build_type_param(
         self, node: ast.AST, scope: RuntimeScope, type_param_bindings: Dict[str, Any]
     ) -> Any:
+        if node.default_value is None and getattr(node, "bound", None) is None:
+            # Plain `T`, `*Ts` and `**P` evaluate nothing, so they need neither a
+            # copy of the bindings, a provisional binding, nor an eval scope.
+            return self._new_provisional_type_param(node, scope)
         eval_bindings = dict(type_param_bindings)
-        private_owner = getattr(scope, "private_owner", None)
+        private_owner = scope.private_owner
         if hasattr(node, "name"):
             provisional = self._new_provisional_type_param(node, scope)
             for binding_name in self._type_param_binding_names(
@@ -277,7 +348,7 @@ class StatementMixin:
                 eval_bindings.setdefault(binding_name, provisional)
         eval_scope = _TypeAliasEvalScope(scope, eval_bindings)
 
-        if isinstance(node, ast.TypeVar):
+        if node.__class__ is ast.TypeVar:
 
             def build_lazy_typevar(
                 *,
@@ -285,45 +356,26 @@ class StatementMixin:
                 constraint_evaluators: tuple[Any, ...] = (),
                 default_evaluator: Any = _MISSING,
             ) -> Any:
-                params: list[str] = []
                 args: list[Any] = []
-
-                annotation = ""
                 if bound_evaluator is not _MISSING:
-                    params.append("__pynterp_eval_bound")
                     args.append(bound_evaluator)
-                    annotation = ": __pynterp_eval_bound()"
-                elif constraint_evaluators:
-                    callback_names = []
-                    for index, evaluator in enumerate(constraint_evaluators):
-                        callback_name = f"__pynterp_eval_constraint_{index}"
-                        params.append(callback_name)
-                        args.append(evaluator)
-                        callback_names.append(f"{callback_name}()")
-                    tuple_expr = ", ".join(callback_names)
-                    if len(callback_names) == 1:
-                        tuple_expr += ","
-                    annotation = f": ({tuple_expr})"
-
-                default_expr = ""
+                else:
+                    args.extend(constraint_evaluators)
                 if default_evaluator is not _MISSING:
-                    params.append("__pynterp_eval_default")
                     args.append(default_evaluator)
-                    default_expr = " = __pynterp_eval_default()"
 
-                param_list = ", ".join(params)
                 module_name = scope.globals.get("__name__", "__main__")
                 helper_globals: Dict[str, Any] = {
                     "__builtins__": scope.builtins,
                     "__name__": module_name if isinstance(module_name, str) else "__main__",
                 }
-                source = (
-                    f"def __pynterp_make_typevar({param_list}):\n"
-                    f"    def __pynterp_tmp[{node.name}{annotation}{default_expr}]():\n"
-                    "        pass\n"
-                    "    return __pynterp_tmp.__type_params__[0]\n"
+                code = _lazy_typevar_factory_code(
+                    node.name,
+                    bound_evaluator is not _MISSING,
+                    len(constraint_evaluators) if bound_evaluator is _MISSING else 0,
+                    default_evaluator is not _MISSING,
                 )
-                safe_host_exec(source, helper_globals, scope.builtins)
+                safe_host_exec(code, helper_globals, scope.builtins)
                 return helper_globals["__pynterp_make_typevar"](*args)
 
             kwargs: Dict[str, Any] = {}
@@ -337,7 +389,7 @@ class StatementMixin:
                     return self._typing_runtime_call(scope, py_typing.TypeVar, node.name, **kwargs)
                 kwargs["default"] = default_evaluator()
                 return self._typing_runtime_call(scope, py_typing.TypeVar, node.name, **kwargs)
-            if isinstance(node.bound, ast.Tuple):
+            if node.bound.__class__ is ast.Tuple:
                 try:
                     constraints = tuple(self.eval_expr(elt, eval_scope) for elt in node.bound.elts)
                 except NameError:
@@ -406,13 +458,13 @@ class StatementMixin:
                 kwargs["default"] = default_evaluator()
             return self._typing_runtime_call(scope, py_typing.TypeVar, node.name, **kwargs)
 
-        if isinstance(node, ast.ParamSpec):
+        if node.__class__ is ast.ParamSpec:
             kwargs: Dict[str, Any] = {}
             if node.default_value is not None:
                 kwargs["default"] = self._eval_type_param_default(node.default_value, eval_scope)
             return self._typing_runtime_call(scope, py_typing.ParamSpec, node.name, **kwargs)
 
-        if isinstance(node, ast.TypeVarTuple):
+        if node.__class__ is ast.TypeVarTuple:
             kwargs: Dict[str, Any] = {}
             if node.default_value is not None:
                 kwargs["default"] = self._eval_type_param_default(node.default_value, eval_scope)
@@ -421,9 +473,11 @@ class StatementMixin:
         raise NotImplementedError(f"Type parameter not supported: {node.__class__.__name__}")
 
     def _build_type_params(self, nodes: Sequence[ast.AST], scope: RuntimeScope) -> tuple[Any, ...]:
+        if not nodes:
+            return ()
         type_param_bindings: Dict[str, Any] = {}
         type_params: list[Any] = []
-        private_owner = getattr(scope, "private_owner", None)
+        private_owner = scope.private_owner
         for type_param_node in nodes:
             type_param = self._build_type_param(type_param_node, scope, type_param_bindings)
             for binding_name in self._type_param_binding_names(
@@ -440,34 +494,18 @@ class StatementMixin:
         scope: RuntimeScope,
         type_param_bindings: Dict[str, Any],
     ) -> Dict[str, Any]:
+        annotation_nodes = scope.code.function_annotation_nodes(node)
+        if not annotation_nodes:
+            return {}
+
         annotations: Dict[str, Any] = {}
         eval_scope = _TypeAliasEvalScope(scope, type_param_bindings)
-        args = node.args
-
-        def eval_annotation(annotation_node: ast.expr) -> Any:
+        for key, annotation_node in annotation_nodes:
             try:
-                return self.eval_expr(annotation_node, eval_scope)
+                annotations[key] = self.eval_expr(annotation_node, eval_scope)
             except NameError:
                 # Defer unresolved names to annotation access time.
-                return ast.unparse(annotation_node)
-
-        for arg in (*args.posonlyargs, *args.args):
-            if arg.annotation is not None:
-                annotations[arg.arg] = eval_annotation(arg.annotation)
-
-        if args.vararg is not None and args.vararg.annotation is not None:
-            annotations[args.vararg.arg] = eval_annotation(args.vararg.annotation)
-
-        for arg in args.kwonlyargs:
-            if arg.annotation is not None:
-                annotations[arg.arg] = eval_annotation(arg.annotation)
-
-        if args.kwarg is not None and args.kwarg.annotation is not None:
-            annotations[args.kwarg.arg] = eval_annotation(args.kwarg.annotation)
-
-        if node.returns is not None:
-            annotations["return"] = eval_annotation(node.returns)
-
+                annotations[key] = ast.unparse(annotation_node)
         return annotations
 
     def _seed_class_namespace(
@@ -495,7 +533,7 @@ class StatementMixin:
                 class_ns[name] = py_builtins.classmethod(value)
 
     def exec_TypeAlias(self, node: ast.TypeAlias, scope: RuntimeScope) -> None:
-        if not isinstance(node.name, ast.Name):
+        if node.name.__class__ is not ast.Name:
             raise NotImplementedError(
                 f"TypeAlias target not supported: {node.name.__class__.__name__}"
             )
@@ -505,7 +543,7 @@ class StatementMixin:
         type_param_bindings = self._build_type_param_binding_map(
             node.type_params,
             type_params,
-            private_owner=getattr(scope, "private_owner", None),
+            private_owner=scope.private_owner,
         )
         alias_eval_scope = _TypeAliasEvalScope(scope, type_param_bindings)
         alias_value = self.eval_expr(node.value, alias_eval_scope)
@@ -535,7 +573,11 @@ class StatementMixin:
     def exec_Assign(self, node: ast.Assign, scope: RuntimeScope) -> None:
         val = self.eval_expr(node.value, scope)
         for tgt in node.targets:
-            self._assign_target(tgt, val, scope)
+            # Plain `name = value` skips the generic target dispatch.
+            if tgt.__class__ is ast.Name:
+                scope.store(self._mangle_private_name(tgt.id, scope), val)
+            else:
+                self._assign_target(tgt, val, scope)
 
     def exec_AnnAssign(self, node: ast.AnnAssign, scope: RuntimeScope) -> None:
         if node.value is not None:
@@ -544,12 +586,12 @@ class StatementMixin:
 
         # Function-local annotations are compile-time metadata only in CPython;
         # evaluating them at runtime raises spurious NameError for local hints.
-        if isinstance(scope, FunctionScope):
+        if scope.SCOPE_KIND == SCOPE_FUNCTION:
             return
 
-        if isinstance(node.target, ast.Name):
+        if node.target.__class__ is ast.Name:
             ann = self.eval_expr(node.annotation, scope)
-            ns = scope.class_ns if isinstance(scope, ClassBodyScope) else scope.globals
+            ns = scope.class_ns if scope.SCOPE_KIND == SCOPE_CLASS else scope.globals
             anns = ns.get("__annotations__")
             if anns is None:
                 anns = {}
@@ -561,13 +603,12 @@ class StatementMixin:
         rhs = self.eval_expr(node.value, scope)
         store(self._apply_augop(node.op, old, rhs))
 
-    def exec_If(self, node: ast.If, scope: RuntimeScope) -> None:
+    def exec_If(self, node: ast.If, scope: RuntimeScope) -> int | None:
         if self.eval_expr(node.test, scope):
-            self.exec_block(node.body, scope)
-        else:
-            self.exec_block(node.orelse, scope)
+            return self.exec_block(node.body, scope)
+        return self.exec_block(node.orelse, scope)
 
-    def exec_Match(self, node: ast.Match, scope: RuntimeScope) -> None:
+    def exec_Match(self, node: ast.Match, scope: RuntimeScope) -> int | None:
         subject = self.eval_expr(node.subject, scope)
         for case in node.cases:
             bindings: Dict[str, Any] = {}
@@ -576,15 +617,13 @@ class StatementMixin:
             for name, value in bindings.items():
                 scope.store(name, value)
             if case.guard is None or self.eval_expr(case.guard, scope):
-                self.exec_block(case.body, scope)
-                return
+                return self.exec_block(case.body, scope)
+        return None
 
     def _merge_match_bindings(self, dst: Dict[str, Any], src: Dict[str, Any]) -> bool:
         for name, value in src.items():
-            if name not in dst:
-                dst[name] = value
-                continue
-            current = dst[name]
+            # One dict probe both binds a new name and fetches an existing one.
+            current = dst.setdefault(name, value)
             if current is value:
                 continue
             try:
@@ -596,48 +635,72 @@ class StatementMixin:
         return True
 
     def _bind_match_name(self, bindings: Dict[str, Any], name: str, value: Any) -> bool:
-        return self._merge_match_bindings(bindings, {name: value})
+        current = bindings.setdefault(name, value)
+        if current is value:
+            return True
+        try:
+            return bool(current == value)
+        except BaseException:
+            return False
 
     def _match_pattern(
         self, pattern: ast.pattern, subject: Any, scope: RuntimeScope, bindings: Dict[str, Any]
     ) -> bool:
-        if isinstance(pattern, ast.MatchValue):
-            return subject == self.eval_expr(pattern.value, scope)
+        handler = self._match_pattern_handlers.get(pattern.__class__)
+        if handler is None:
+            raise NotImplementedError(f"Pattern not supported: {pattern.__class__.__name__}")
+        return handler(pattern, subject, scope, bindings)
 
-        if isinstance(pattern, ast.MatchSingleton):
-            return subject is pattern.value
-
-        if isinstance(pattern, ast.MatchSequence):
-            return self._match_sequence_pattern(pattern, subject, scope, bindings)
+    def _match_value_pattern(
+        self,
+        pattern: ast.MatchValue,
+        subject: Any,
+        scope: RuntimeScope,
+        bindings: Dict[str, Any],
+    ) -> bool:
+        return subject == self.eval_expr(pattern.value, scope)
 
-        if isinstance(pattern, ast.MatchMapping):
-            return self._match_mapping_pattern(pattern, subject, scope, bindings)
+    def _match_singleton_pattern(
+        self,
+        pattern: ast.MatchSingleton,
+        subject: Any,
+        scope: RuntimeScope,
+        bindings: Dict[str, Any],
+    ) -> bool:
+        return subject is pattern.value
 
-        if isinstance(pattern, ast.MatchClass):
-            return self._match_class_pattern(pattern, subject, scope, bindings)
+    def _match_as_pattern(
+        self,
+        pattern: ast.MatchAs,
+        subject: Any,
+        scope: RuntimeScope,
+        bindings: Dict[str, Any],
+    ) -> bool:
+        if pattern.pattern is not None:
+            if not self._match_pattern(pattern.pattern, subject, scope, bindings):
+                return False
+        if pattern.name is not None:
+            return self._bind_match_name(bindings, pattern.name, subject)
+        return True
 
-        if isinstance(pattern, ast.MatchAs):
-            if pattern.pattern is not None:
-                inner_bindings: Dict[str, Any] = {}
-                if not self._match_pattern(pattern.pattern, subject, scope, inner_bindings):
-                    return False
-                if not self._merge_match_bindings(bindings, inner_bindings):
-                    return False
-            if pattern.name is not None:
-                return self._bind_match_name(bindings, pattern.name, subject)
+    def _match_or_pattern(
+        self,
+        pattern: ast.MatchOr,
+        subject: Any,
+        scope: RuntimeScope,
+        bindings: Dict[str, Any],
+    ) -> bool:
+        # Other patterns bind straight into `bindings`, since any failing
+        # subpattern fails the whole case. A failed alternative here must
+        # leave nothing behind, so each one gets its own dict.
+        for subpattern in pattern.patterns:
+            inner_bindings: Dict[str, Any] = {}
+            if not self._match_pattern(subpattern, subject, scope, inner_bindings):
+                continue
+            if not self._merge_match_bindings(bindings, inner_bindings):
+                return False
             return True
-
-        if isinstance(pattern, ast.MatchOr):
-            for subpattern in pattern.patterns:
-                inner_bindings: Dict[str, Any] = {}
-                if not self._match_pattern(subpattern, subject, scope, inner_bindings):
-                    continue
-                if not self._merge_match_bindings(bindings, inner_bindings):
-                    return False
-                return True
-            return False
-
-        raise NotImplementedError(f"Pattern not supported: {pattern.__class__.__name__}")
+        return False
 
     def _match_sequence_pattern(
         self,
@@ -653,54 +716,36 @@ class StatementMixin:
         if not isinstance(subject, Sequence):
             return False
 
-        items = list(subject)
-        patterns = list(pattern.patterns)
-        star_index = None
-        for idx, subpattern in enumerate(patterns):
-            if isinstance(subpattern, ast.MatchStar):
-                star_index = idx
-                break
+        head_patterns, star_pattern, tail_patterns = scope.code.sequence_pattern_layout(pattern)
+        # Lists and tuples can be indexed as-is; other sequences are copied once.
+        items = subject if subject.__class__ in (list, tuple) else list(subject)
 
-        if star_index is None:
-            if len(items) != len(patterns):
+        if star_pattern is None:
+            if len(items) != len(head_patterns):
                 return False
-            for subpattern, item in zip(patterns, items):
-                inner_bindings: Dict[str, Any] = {}
-                if not self._match_pattern(subpattern, item, scope, inner_bindings):
-                    return False
-                if not self._merge_match_bindings(bindings, inner_bindings):
+            for subpattern, item in zip(head_patterns, items):
+                if not self._match_pattern(subpattern, item, scope, bindings):
                     return False
             return True
 
-        head_patterns = patterns[:star_index]
-        tail_patterns = patterns[star_index + 1 :]
-        if len(items) < len(head_patterns) + len(tail_patterns):
+        head_count = len(head_patterns)
+        tail_count = len(tail_patterns)
+        if len(items) < head_count + tail_count:
             return False
 
         for subpattern, item in zip(head_patterns, items):
-            inner_bindings: Dict[str, Any] = {}
-            if not self._match_pattern(subpattern, item, scope, inner_bindings):
-                return False
-            if not self._merge_match_bindings(bindings, inner_bindings):
+            if not self._match_pattern(subpattern, item, scope, bindings):
                 return False
 
-        star_pattern = patterns[star_index]
-        if not isinstance(star_pattern, ast.MatchStar):
-            raise RuntimeError("internal error: expected MatchStar")
-        star_count = len(items) - len(head_patterns) - len(tail_patterns)
-        star_values = list(items[len(head_patterns) : len(head_patterns) + star_count])
+        star_end = len(items) - tail_count
         if star_pattern.name is not None and not self._bind_match_name(
-            bindings, star_pattern.name, star_values
+            bindings, star_pattern.name, list(items[head_count:star_end])
         ):
             return False
 
         if tail_patterns:
-            tail_items = items[len(items) - len(tail_patterns) :]
-            for subpattern, item in zip(tail_patterns, tail_items):
-                inner_bindings = {}
-                if not self._match_pattern(subpattern, item, scope, inner_bindings):
-                    return False
-                if not self._merge_match_bindings(bindings, inner_bindings):
+            for subpattern, item in zip(tail_patterns, items[star_end:]):
+                if not self._match_pattern(subpattern, item, scope, bindings):
                     return False
 
         return True
@@ -715,19 +760,33 @@ class StatementMixin:
         if not isinstance(subject, Mapping):
             return False
 
+        # Like CPython: a subject with fewer items than keys never matches, and
+        # is rejected before any key expression runs.
+        if len(subject) < len(pattern.keys):
+            return False
+
         keys: list[Any] = []
         for key_node in pattern.keys:
             keys.append(self.eval_expr(key_node, scope))
 
-        for index, key in enumerate(keys):
-            for previous in keys[:index]:
-                if key == previous:
-                    raise ValueError(f"mapping pattern checks duplicate key ({key!r})")
-
+        # Duplicate checks and lookups share one pass and stop at the first
+        # missing key. Hashable keys (the common case) are checked through a
+        # set; anything unhashable falls back to a linear equality scan.
+        get = getattr(subject, "get", None)
+        seen_keys: set[Any] = set()
+        unhashable_keys: list[Any] = []
         matched_values: list[Any] = []
         for key in keys:
-            if hasattr(subject, "get"):
-                value = subject.get(key, _MISSING)
+            try:
+                duplicate = key in seen_keys
+                seen_keys.add(key)
+            except TypeError:
+                duplicate = any(key == previous for previous in unhashable_keys)
+                unhashable_keys.append(key)
+            if duplicate:
+                raise ValueError(f"mapping pattern checks duplicate key ({key!r})")
+            if get is not None:
+                value = get(key, _MISSING)
             else:
                 try:
                     value = subject[key]
@@ -738,16 +797,19 @@ class StatementMixin:
             matched_values.append(value)
 
         for subpattern, value in zip(pattern.patterns, matched_values):
-            inner_bindings: Dict[str, Any] = {}
-            if not self._match_pattern(subpattern, value, scope, inner_bindings):
-                return False
-            if not self._merge_match_bindings(bindings, inner_bindings):
+            if not self._match_pattern(subpattern, value, scope, bindings):
                 return False
 
         if pattern.rest is not None:
             rest: Dict[Any, Any] = {}
             for key, value in subject.items():
-                if any(key == matched_key for matched_key in keys):
+                try:
+                    matched = key in seen_keys
+                except TypeError:
+                    matched = False
+                if matched or (
+                    unhashable_keys and any(key == matched_key for matched_key in unhashable_keys)
+                ):
                     continue
                 rest[key] = value
             if not self._bind_match_name(bindings, pattern.rest, rest):
@@ -767,16 +829,18 @@ class StatementMixin:
         if not self._runtime_isinstance(subject, cls):
             return False
 
-        positional_patterns = list(pattern.patterns)
-        keyword_attrs = list(pattern.kwd_attrs)
-        keyword_patterns = list(pattern.kwd_patterns)
+        positional_patterns = pattern.patterns
+        keyword_attrs = pattern.kwd_attrs
+        keyword_patterns = pattern.kwd_patterns
         positional_attrs: list[str] = []
         match_self = False
 
         if positional_patterns:
             match_args = getattr(cls, "__match_args__", _MISSING)
             if match_args is _MISSING:
-                if cls in _BUILTIN_MATCH_SELF_TYPES:
+                # Only plain `type` instances can be builtins; this also keeps a
+                # metaclass with __eq__ (and thus no __hash__) out of the set probe.
+                if cls.__class__ is type and cls in _BUILTIN_MATCH_SELF_TYPES:
                     match_self = True
                     match_args = ("__match_self__",)
                 else:
@@ -795,68 +859,98 @@ class StatementMixin:
                     )
                 positional_attrs.append(attr)
 
-        seen_attrs = set()
-        for attr in positional_attrs:
-            if attr in seen_attrs:
-                raise TypeError(f"{cls.__name__}() got multiple sub-patterns for {attr!r}")
-            seen_attrs.add(attr)
-        for attr in keyword_attrs:
-            if attr in seen_attrs:
-                raise TypeError(f"{cls.__name__}() got multiple sub-patterns for {attr!r}")
-            seen_attrs.add(attr)
-
-        for subpattern, attr in zip(positional_patterns, positional_attrs):
+        # __match_args__ is read per match (it may be reassigned), but a pattern
+        # naming a single attribute cannot repeat one, so skip the set then.
+        if len(positional_attrs) + len(keyword_attrs) > 1:
+            seen_attrs = set()
+            for attr in (*positional_attrs, *keyword_attrs):
+                if attr in seen_attrs:
+                    raise TypeError(f"{cls.__name__}() got multiple sub-patterns for {attr!r}")
+                seen_attrs.add(attr)
+
+        # Index both lists directly: positional_attrs was sized to the patterns,
+        # and the parser keeps kwd_attrs and kwd_patterns the same length.
+        for index in range(len(positional_attrs)):
+            subpattern = positional_patterns[index]
+            attr = positional_attrs[index]
             if match_self and attr == "__match_self__":
                 value = subject
             else:
                 value = safe_getattr(subject, attr, _MISSING)
                 if value is _MISSING:
                     return False
-            inner_bindings: Dict[str, Any] = {}
-            if not self._match_pattern(subpattern, value, scope, inner_bindings):
-                return False
-            if not self._merge_match_bindings(bindings, inner_bindings):
+            if not self._match_pattern(subpattern, value, scope, bindings):
                 return False
 
-        for attr, subpattern in zip(keyword_attrs, keyword_patterns):
+        for index in range(len(keyword_attrs)):
+            attr = keyword_attrs[index]
             value = safe_getattr(subject, attr, _MISSING)
             if value is _MISSING:
                 return False
-            inner_bindings: Dict[str, Any] = {}
-            if not self._match_pattern(subpattern, value, scope, inner_bindings):
-                return False
-            if not self._merge_match_bindings(bindings, inner_bindings):
+            if not self._match_pattern(keyword_patterns[index], value, scope, bindings):
                 return False
 
         return True
 
-    def exec_While(self, node: ast.While, scope: RuntimeScope) -> None:
-        broke = False
-        while self.eval_expr(node.test, scope):
+    # Loops see break/continue as exec_block statuses; the Break/Continue
+    # signals only arrive from inside try statements.
+
+    def exec_While(self, node: ast.While, scope: RuntimeScope) -> int | None:
+        eval_expr = self.eval_expr
+        exec_block = self.exec_block
+        test = node.test
+        body = node.body
+        while eval_expr(test, scope):
             try:
-                self.exec_block(node.body, scope)
+                status = exec_block(body, scope)
             except ContinueSignal:
                 continue
             except BreakSignal:
-                broke = True
-                break
-        if (not broke) and node.orelse:
-            self.exec_block(node.orelse, scope)
-
-    def exec_For(self, node: ast.For, scope: RuntimeScope) -> None:
+                return None
+            if status == STATUS_BREAK:
+                return None
+        if node.orelse:
+            return self.exec_block(node.orelse, scope)
+        return None
+
+    def exec_For(self, node: ast.For, scope: RuntimeScope) -> int | None:
         it = self.eval_expr(node.iter, scope)
-        broke = False
+        exec_block = self.exec_block
+        target = node.target
+        body = node.body
+        fast_locals = None
+        if target.__class__ is ast.Name:
+            # The loop variable is stored every iteration; resolve its
+            # (possibly mangled) name and the store method once. A plain
+            # function local is written straight into its fast-locals slot.
+            store = scope.store
+            name = self._mangle_private_name(target.id, scope)
+            if scope.SCOPE_KIND == SCOPE_FUNCTION:
+                slot = scope.scope_info.slots.get(name)
+                if slot is not None and slot[0] == NAME_LOCAL:
+                    fast_locals = scope.locals
+                    index = slot[1]
+        else:
+            store = None
+            assign_target = self._assign_target
         for item in it:
-            self._assign_target(node.target, item, scope)
+            if fast_locals is not None:
+                fast_locals[index] = item
+            elif store is not None:
+                store(name, item)
+            else:
+                assign_target(target, item, scope)
             try:
-                self.exec_block(node.body, scope)
+                status = exec_block(body, scope)
             except ContinueSignal:
                 continue
             except BreakSignal:
-                broke = True
-                break
-        if (not broke) and node.orelse:
-            self.exec_block(node.orelse, scope)
+                return None
+            if status == STATUS_BREAK:
+                return None
+        if node.orelse:
+            return self.exec_block(node.orelse, scope)
+        return None
 
     def _async_for_iter(self, iterable: Any) -> Any:
         try:
@@ -891,6 +985,94 @@ class StatementMixin:
 
         return _AsyncForAwaitable(await_iter), next_value, message
 
+    def _enter_context_manager(self, manager: Any) -> tuple[Any, Any]:
+        """Call ``manager.__enter__()`` and return ``(value, exit_callable)``."""
+        # Like CPython's BEFORE_WITH, the hooks are looked up on the type only.
+        manager_type = type(manager)
+        enter = _lookup_special(manager_type, "__enter__")
+        if enter is _MISSING:
+            raise TypeError(
+                f"'{manager_type.__qualname__}' object does not support the "
+                "context manager protocol"
+            )
+        exit_ = _lookup_special(manager_type, "__exit__")
+        if exit_ is _MISSING:
+            raise TypeError(
+                f"'{manager_type.__qualname__}' object does not support the "
+                "context manager protocol (missed __exit__ method)"
+            )
+        if enter.__class__ is UserFunction and exit_.__class__ is UserFunction:
+            # Interpreted managers: call the class functions directly instead of
+            # allocating BoundMethod wrappers for both hooks.
+            return enter(manager), functools.partial(exit_, manager)
+        enter = _bind_special(enter, manager, manager_type)
+        exit_ = _bind_special(exit_, manager, manager_type)
+        return enter(), exit_
+
+    def _exit_context_managers(self, exits: list[Any]) -> bool:
+        """Unwind `exits` innermost-first with no exception in flight.
+
+        If an exit hook raises, the remaining outer hooks see that exception. The
+        result is False when one of them suppressed it, so the caller falls
+        through instead of finishing its break/continue/return.
+        """
+        for index in range(len(exits) - 1, -1, -1):
+            try:
+                exits[index](None, None, None)
+            except BaseException as exc:
+                self._exit_context_managers_with_exception(exits[:index], exc)
+                return False
+        return True
+
+    def _exit_context_managers_with_exception(self, exits: list[Any], exc: BaseException) -> None:
+        """Unwind `exits` innermost-first for `exc`; re-raise unless a manager suppresses it."""
+        exc_type: Any = type(exc)
+        tb = exc.__traceback__
+        for exit_ in reversed(exits):
+            try:
+                suppress = exit_(exc_type, exc, tb)
+            except BaseException as new_exc:
+                exc_type = type(new_exc)
+                exc = new_exc
+                tb = new_exc.__traceback__
+                continue
+            if suppress:
+                exc_type = exc = tb = None
+        if exc_type is not None:
+            raise exc
+
+    def _g_exit_async_context_managers(self, exits: list[Any]) -> Iterator[Any]:
+        """Await `__aexit__` hooks like _exit_context_managers unwinds sync ones."""
+        for index in range(len(exits) - 1, -1, -1):
+            try:
+                yield AwaitRequest(
+                    self._async_with_awaitable(exits[index](None, None, None), "__aexit__")
+                )
+            except BaseException as exc:
+                yield from self._g_exit_async_context_managers_with_exception(exits[:index], exc)
+                return False
+        return True
+
+    def _g_exit_async_context_managers_with_exception(
+        self, exits: list[Any], exc: BaseException
+    ) -> Iterator[Any]:
+        exc_type: Any = type(exc)
+        tb = exc.__traceback__
+        for index in range(len(exits) - 1, -1, -1):
+            try:
+                suppress = yield AwaitRequest(
+                    self._async_with_awaitable(exits[index](exc_type, exc, tb), "__aexit__")
+                )
+            except BaseException as new_exc:
+                exc_type = type(new_exc)
+                exc = new_exc
+                tb = new_exc.__traceback__
+                continue
+            if suppress:
+                exc_type = exc = tb = None
+        if exc_type is not None:
+            raise exc
+
     def _async_with_method(self, manager: Any, method_name: str) -> Any:
         method = getattr(manager, method_name, None)
         if method is None:
@@ -915,11 +1097,11 @@ class StatementMixin:
             raise TypeError(message) from exc
         return _AsyncForAwaitable(await_iter)
 
-    def exec_Break(self, node: ast.Break, scope: RuntimeScope) -> None:
-        raise BreakSignal()
+    def exec_Break(self, node: ast.Break, scope: RuntimeScope) -> int:
+        return STATUS_BREAK
 
-    def exec_Continue(self, node: ast.Continue, scope: RuntimeScope) -> None:
-        raise ContinueSignal()
+    def exec_Continue(self, node: ast.Continue, scope: RuntimeScope) -> int:
+        return STATUS_CONTINUE
 
     def exec_Return(self, node: ast.Return, scope: RuntimeScope) -> None:
         val = self.eval_expr(node.value, scope) if node.value is not None else None
@@ -936,34 +1118,100 @@ class StatementMixin:
     def exec_Nonlocal(self, node: ast.Nonlocal, scope: RuntimeScope) -> None:
         return
 
+    def _eval_decorators(self, decorator_list: list[ast.expr], scope: RuntimeScope) -> list[Any]:
+        # CPython evaluates decorator expressions top-down before the definition
+        # itself (defaults, bases), then applies them bottom-up.
+        if not decorator_list:
+            return []
+        return [self.eval_expr(d, scope) for d in decorator_list]
+
+    def _g_eval_decorators(
+        self, decorator_list: list[ast.expr], scope: RuntimeScope
+    ) -> Iterator[Any]:
+        decorators: list[Any] = []
+        for d in decorator_list:
+            decorators.append((yield from self.g_eval_expr(d, scope)))
+        return decorators
+
+    def _apply_decorators(self, decorators: list[Any], value: Any) -> Any:
+        while decorators:
+            value = decorators.pop()(value)
+        return value
+
+    def _eval_function_defaults(
+        self, args: ast.arguments, scope: RuntimeScope
+    ) -> tuple[Sequence[Any], Sequence[Any]]:
+        # Most defs have no defaults; share the empty tuple instead of building lists.
+        defaults: Sequence[Any] = ()
+        kw_defaults: Sequence[Any] = ()
+        # Literal defaults (`x=0`, `flag=None`) are read off the node directly.
+        eval_expr = self.eval_expr
+        if args.defaults:
+            defaults = [
+                d.value if d.__class__ is ast.Constant else eval_expr(d, scope)
+                for d in args.defaults
+            ]
+        if args.kw_defaults:
+            kw_defaults = []
+            for d in args.kw_defaults:
+                if d is None:
+                    kw_defaults.append(NO_DEFAULT)
+                elif d.__class__ is ast.Constant:
+                    kw_defaults.append(d.value)
+                else:
+                    kw_defaults.append(eval_expr(d, scope))
+        return defaults, kw_defaults
+
+    def _g_eval_function_defaults(self, args: ast.arguments, scope: RuntimeScope) -> Iterator[Any]:
+        defaults: Sequence[Any] = ()
+        kw_defaults: Sequence[Any] = ()
+        if args.defaults:
+            defaults = []
+            for d in args.defaults:
+                if d.__class__ is ast.Constant:
+                    defaults.append(d.value)
+                else:
+                    defaults.append((yield from self.g_eval_expr(d, scope)))
+        if args.kw_defaults:
+            kw_defaults = []
+            for d in args.kw_defaults:
+                if d is None:
+                    kw_defaults.append(NO_DEFAULT)
+                elif d.__class__ is ast.Constant:
+                    kw_defaults.append(d.value)
+                else:
+                    kw_defaults.append((yield from self.g_eval_expr(d, scope)))
+        return defaults, kw_defaults
+
     def _make_user_function(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
         scope: RuntimeScope,
-        defaults: list[Any],
-        kw_defaults: list[Any],
+        defaults: Sequence[Any],
+        kw_defaults: Sequence[Any],
         *,
         is_async: bool,
     ) -> UserFunction:
-        contains_yield = _contains_yield(node)
-
-        fn_table = scope.code.lookup_function_table(node)
-        fn_scope_info = scope.code.scope_info_for(fn_table)
+        fn_scope_info, contains_yield = scope.code.function_info(node)
         type_param_nodes = getattr(node, "type_params", ()) or ()
         type_params = self._build_type_params(type_param_nodes, scope)
         type_param_bindings = self._build_type_param_binding_map(
             type_param_nodes,
             type_params,
-            private_owner=getattr(scope, "private_owner", None),
+            private_owner=scope.private_owner,
         )
         annotations = self._build_function_annotations(node, scope, type_param_bindings)
-        closure: Dict[str, Cell] = {}
-        for free_name in fn_scope_info.frees:
-            type_param = type_param_bindings.get(free_name, _MISSING)
-            if type_param is not _MISSING:
-                closure[free_name] = Cell(type_param)
-                continue
-            closure[free_name] = scope.capture_cell(free_name)
+        # Most defs capture nothing; UserFunction keeps the shared empty tuple then.
+        free_cells: Sequence[Cell] = ()
+        if fn_scope_info.free_names:
+            captured: list[Cell] = []
+            for free_name in fn_scope_info.free_names:
+                type_param = type_param_bindings.get(free_name, _MISSING)
+                if type_param is not _MISSING:
+                    captured.append(Cell(type_param))
+                    continue
+                captured.append(scope.capture_cell(free_name))
+            free_cells = captured
 
         return UserFunction(
             interpreter=self,
@@ -972,7 +1220,7 @@ class StatementMixin:
             globals_dict=scope.globals,
             builtins_dict=scope.builtins,
             scope_info=fn_scope_info,
-            closure=closure,
+            free_cells=free_cells,
             defaults=defaults,
             kw_defaults=kw_defaults,
             is_generator=(not is_async) and contains_yield,
@@ -981,15 +1229,12 @@ class StatementMixin:
             qualname=self._qualname_for_definition(node.name, scope),
             type_params=type_params,
             annotations=annotations,
-            private_owner=getattr(scope, "private_owner", None),
+            private_owner=scope.private_owner,
         )
 
     def exec_FunctionDef(self, node: ast.FunctionDef, scope: RuntimeScope) -> None:
-        defaults = [self.eval_expr(d, scope) for d in (node.args.defaults or [])]
-        kw_defaults = [
-            (self.eval_expr(d, scope) if d is not None else NO_DEFAULT)
-            for d in (getattr(node.args, "kw_defaults", []) or [])
-        ]
+        decorators = self._eval_decorators(node.decorator_list, scope)
+        defaults, kw_defaults = self._eval_function_defaults(node.args, scope)
         func = self._make_user_function(
             node,
             scope,
@@ -998,19 +1243,12 @@ class StatementMixin:
             is_async=False,
         )
 
-        decorated: Any = func
-        for dec_node in reversed(node.decorator_list or []):
-            dec = self.eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, func)
         self._store_definition_name(scope, node.name, decorated)
 
     def exec_AsyncFunctionDef(self, node: ast.AsyncFunctionDef, scope: RuntimeScope) -> None:
-        defaults = [self.eval_expr(d, scope) for d in (node.args.defaults or [])]
-        kw_defaults = [
-            (self.eval_expr(d, scope) if d is not None else NO_DEFAULT)
-            for d in (getattr(node.args, "kw_defaults", []) or [])
-        ]
+        decorators = self._eval_decorators(node.decorator_list, scope)
+        defaults, kw_defaults = self._eval_function_defaults(node.args, scope)
         func = self._make_user_function(
             node,
             scope,
@@ -1019,14 +1257,11 @@ class StatementMixin:
             is_async=True,
         )
 
-        decorated: Any = func
-        for dec_node in reversed(node.decorator_list or []):
-            dec = self.eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, func)
         self._store_definition_name(scope, node.name, decorated)
 
     def exec_ClassDef(self, node: ast.ClassDef, scope: RuntimeScope) -> None:
+        decorators = self._eval_decorators(node.decorator_list, scope)
         type_param_nodes = getattr(node, "type_params", ()) or ()
         type_params = self._build_type_params(type_param_nodes, scope)
         type_param_bindings = self._build_type_param_binding_map(
@@ -1075,17 +1310,13 @@ class StatementMixin:
             type_param_cells=type_param_cells,
             private_owner=node.name,
         )
-        self.exec_block(node.body, body_scope)
+        self.exec_block_raising(node.body, body_scope)
         self._normalize_class_namespace(class_ns)
 
         cls = mark_runtime_owned(meta(node.name, bases, class_ns, **kw))
         class_cell.value = cls
 
-        decorated: Any = cls
-        for dec_node in reversed(node.decorator_list or []):
-            dec = self.eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, cls)
         self._store_definition_name(scope, node.name, decorated)
 
     def _except_star_targets_exception_group(self, exc_type: Any) -> bool:
@@ -1099,6 +1330,23 @@ class StatementMixin:
         except TypeError:
             return False
 
+    def _try_star_type_misses(self, exc: BaseException, exc_type: Any) -> bool:
+        # Same subclass test ExceptionGroup.split() applies to a class or tuple
+        # of classes; anything else is left to split() and its type checks.
+        exc_types = exc_type if exc_type.__class__ is tuple else (exc_type,)
+        exc_mro = type(exc).__mro__
+        for item in exc_types:
+            if not isinstance(item, type) or BaseException not in item.__mro__:
+                return False
+            if item in exc_mro:
+                return False
+        return True
+
+    def _wrap_try_star_exception(self, exc: BaseException) -> BaseException:
+        if isinstance(exc, Exception):
+            return py_builtins.ExceptionGroup("", [exc])
+        return py_builtins.BaseExceptionGroup("", [exc])
+
     def _split_try_star_pending(
         self,
         pending: py_builtins.BaseExceptionGroup,
@@ -1150,79 +1398,79 @@ class StatementMixin:
             )
         raise py_builtins.BaseExceptionGroup("", members)
 
-    def exec_Try(self, node: ast.Try, scope: RuntimeScope) -> None:
+    def exec_Try(self, node: ast.Try, scope: RuntimeScope) -> int | None:
         finalbody_exception = scope.active_exception
+        # A break/continue status from the body or a handler is returned after
+        # the finally clause runs instead of being raised through it.
         try:
-            self.exec_block(node.body, scope)
+            status = self.exec_block(node.body, scope)
+        except ControlFlowSignal:
+            raise
         except BaseException as e:
-            if isinstance(e, ControlFlowSignal):
-                raise
             finalbody_exception = e
-            handled = False
             for handler in node.handlers:
-                if handler.type is None:
-                    match = True
-                else:
+                if handler.type is not None:
                     exc_type = self.eval_expr(handler.type, scope)
-                    match = self._runtime_isinstance(e, exc_type)
-                if match:
-                    handled = True
-                    if handler.name:
-                        scope.store(handler.name, e)
-                    previous_exception = scope.active_exception
-                    scope.active_exception = e
-                    try:
-                        self.exec_block(handler.body, scope)
-                    except ControlFlowSignal:
-                        # Returning/breaking/continuing from an except handler
-                        # clears the in-flight exception before finally runs.
-                        finalbody_exception = previous_exception
-                        raise
-                    except BaseException as handler_exc:
-                        finalbody_exception = handler_exc
-                        raise
-                    else:
-                        finalbody_exception = e
-                    finally:
-                        scope.active_exception = previous_exception
-                        if handler.name:
-                            scope.unbind(handler.name)
-                    break
-            if not handled:
+                    # An exact class match needs no isinstance/membrane check.
+                    if exc_type is not type(e) and not self._runtime_isinstance(e, exc_type):
+                        continue
+                name = handler.name
+                if name:
+                    scope.store(name, e)
+                previous_exception = scope.active_exception
+                scope.active_exception = e
+                try:
+                    status = self.exec_block(handler.body, scope)
+                except ControlFlowSignal:
+                    # Returning/breaking/continuing from an except handler
+                    # clears the in-flight exception before finally runs.
+                    finalbody_exception = previous_exception
+                    raise
+                except BaseException as handler_exc:
+                    finalbody_exception = handler_exc
+                    raise
+                else:
+                    # Leaving the handler via break/continue clears it too.
+                    finalbody_exception = e if status is None else previous_exception
+                finally:
+                    scope.active_exception = previous_exception
+                    if name:
+                        scope.unbind(name)
+                break
+            else:
                 raise
         else:
-            if node.orelse:
+            if status is None and node.orelse:
                 try:
-                    self.exec_block(node.orelse, scope)
+                    status = self.exec_block(node.orelse, scope)
+                except ControlFlowSignal:
+                    raise
                 except BaseException as orelse_exc:
-                    if not isinstance(orelse_exc, ControlFlowSignal):
-                        finalbody_exception = orelse_exc
+                    finalbody_exception = orelse_exc
                     raise
         finally:
             if node.finalbody:
                 previous_exception = scope.active_exception
                 scope.active_exception = finalbody_exception
                 try:
-                    self.exec_block(node.finalbody, scope)
+                    self.exec_block_raising(node.finalbody, scope)
                 finally:
                     scope.active_exception = previous_exception
+        return status
 
-    def exec_TryStar(self, node: ast.TryStar, scope: RuntimeScope) -> None:
+    def exec_TryStar(self, node: ast.TryStar, scope: RuntimeScope) -> int | None:
+        # Loop control in the body or else clause comes back as a status, as
+        # in exec_Try; except* handlers cannot contain break/continue/return.
+        status = None
         try:
-            self.exec_block(node.body, scope)
+            status = self.exec_block(node.body, scope)
+        except ControlFlowSignal:
+            raise
         except BaseException as e:
-            if isinstance(e, ControlFlowSignal):
-                raise
-
-            if isinstance(e, py_builtins.BaseExceptionGroup):
-                pending: BaseException | None = e
-                original_was_group = True
-            else:
-                if isinstance(e, Exception):
-                    pending = py_builtins.ExceptionGroup("", [e])
-                else:
-                    pending = py_builtins.BaseExceptionGroup("", [e])
-                original_was_group = False
+            # A lone exception is only wrapped in a group once a handler may
+            # match it; when every handler misses it is re-raised unwrapped.
+            pending: BaseException | None = e
+            original_was_group = isinstance(e, py_builtins.BaseExceptionGroup)
 
             raised: list[BaseException] = []
             for handler in node.handlers:
@@ -1236,6 +1484,10 @@ class StatementMixin:
                     raise TypeError(
                         "catching ExceptionGroup with except* is not allowed. Use except instead."
                     )
+                if pending is e and not original_was_group:
+                    if self._try_star_type_misses(e, exc_type):
+                        continue
+                    pending = self._wrap_try_star_exception(e)
                 matched, pending = self._split_try_star_pending(pending, exc_type)
                 if matched is None:
                     continue
@@ -1250,10 +1502,10 @@ class StatementMixin:
                 except BaseException as current_exception:
                     scope.active_exception = current_exception
                     try:
-                        self.exec_block(handler.body, scope)
+                        self.exec_block_raising(handler.body, scope)
+                    except ControlFlowSignal:
+                        raise
                     except BaseException as new_e:
-                        if isinstance(new_e, ControlFlowSignal):
-                            raise
                         raised.append(new_e)
                 finally:
                     scope.active_exception = previous_exception
@@ -1268,11 +1520,12 @@ class StatementMixin:
             )
 
         else:
-            if node.orelse:
-                self.exec_block(node.orelse, scope)
+            if status is None and node.orelse:
+                status = self.exec_block(node.orelse, scope)
         finally:
             if node.finalbody:
-                self.exec_block(node.finalbody, scope)
+                self.exec_block_raising(node.finalbody, scope)
+        return status
 
     def exec_Raise(self, node: ast.Raise, scope: RuntimeScope) -> None:
         if node.exc is None:
@@ -1285,48 +1538,29 @@ class StatementMixin:
         cause = self.eval_expr(node.cause, scope)
         self._raise_with_optional_cause(exc, cause)
 
-    def exec_With(self, node: ast.With, scope: RuntimeScope) -> None:
+    def exec_With(self, node: ast.With, scope: RuntimeScope) -> int | None:
         exits = []
         try:
             for item in node.items:
                 mgr = self.eval_expr(item.context_expr, scope)
-                enter = getattr(mgr, "__enter__")
-                exit_ = getattr(mgr, "__exit__")
-                val = enter()
+                val, exit_ = self._enter_context_manager(mgr)
                 exits.append(exit_)
                 if item.optional_vars is not None:
                     self._assign_target(item.optional_vars, val, scope)
 
-            self.exec_block(node.body, scope)
+            status = self.exec_block(node.body, scope)
 
         except ControlFlowSignal:
-            for exit_ in reversed(exits):
-                exit_(None, None, None)
-            raise
+            if self._exit_context_managers(exits):
+                raise
 
         except BaseException as e:
-            exc_type = type(e)
-            exc = e
-            tb = e.__traceback__
-
-            for exit_ in reversed(exits):
-                try:
-                    suppress = exit_(exc_type, exc, tb)
-                except BaseException as new_e:
-                    exc_type = type(new_e)
-                    exc = new_e
-                    tb = new_e.__traceback__
-                    continue
-                if suppress:
-                    exc_type = exc = tb = None
-
-            if exc_type is None:
-                return
-            raise exc
+            self._exit_context_managers_with_exception(exits, e)
 
         else:
-            for exit_ in reversed(exits):
-                exit_(None, None, None)
+            if self._exit_context_managers(exits):
+                return status
+        return None
 
     def exec_AsyncWith(self, node: ast.AsyncWith, scope: RuntimeScope) -> None:
         raise SyntaxError("'async with' is only valid in async functions")
@@ -1372,11 +1606,17 @@ class StatementMixin:
     def g_exec_Assign(self, node: ast.Assign, scope: RuntimeScope) -> Iterator[Any]:
         val = yield from self.g_eval_expr(node.value, scope)
         for tgt in node.targets:
-            yield from self.g_assign_target(tgt, val, scope)
+            if tgt.__class__ is ast.Name:
+                scope.store(self._mangle_private_name(tgt.id, scope), val)
+            else:
+                yield from self.g_assign_target(tgt, val, scope)
         return
 
     def g_exec_Assert(self, node: ast.Assert, scope: RuntimeScope) -> Iterator[Any]:
-        test = yield from self.g_eval_expr(node.test, scope)
+        if scope.code.expr_can_suspend(node.test):
+            test = yield from self.g_eval_expr(node.test, scope)
+        else:
+            test = self.eval_expr(node.test, scope)
         if test:
             return
         if node.msg is None:
@@ -1388,11 +1628,11 @@ class StatementMixin:
         if node.value is not None:
             val = yield from self.g_eval_expr(node.value, scope)
             yield from self.g_assign_target(node.target, val, scope)
-        if isinstance(scope, FunctionScope):
+        if scope.SCOPE_KIND == SCOPE_FUNCTION:
             return
-        if isinstance(node.target, ast.Name):
+        if node.target.__class__ is ast.Name:
             ann = yield from self.g_eval_expr(node.annotation, scope)
-            ns = scope.class_ns if isinstance(scope, ClassBodyScope) else scope.globals
+            ns = scope.class_ns if scope.SCOPE_KIND == SCOPE_CLASS else scope.globals
             anns = ns.get("__annotations__")
             if anns is None:
                 anns = {}
@@ -1407,12 +1647,15 @@ class StatementMixin:
         return
 
     def g_exec_If(self, node: ast.If, scope: RuntimeScope) -> Iterator[Any]:
-        test = yield from self.g_eval_expr(node.test, scope)
-        if test:
-            yield from self.g_exec_block(node.body, scope)
+        # Conditions and loop iterables that cannot yield or await skip the
+        # generator-mode evaluator entirely.
+        if scope.code.expr_can_suspend(node.test):
+            test = yield from self.g_eval_expr(node.test, scope)
         else:
-            yield from self.g_exec_block(node.orelse, scope)
-        return
+            test = self.eval_expr(node.test, scope)
+        if test:
+            return (yield from self.g_exec_block(node.body, scope))
+        return (yield from self.g_exec_block(node.orelse, scope))
 
     def g_exec_Match(self, node: ast.Match, scope: RuntimeScope) -> Iterator[Any]:
         subject = yield from self.g_eval_expr(node.subject, scope)
@@ -1426,47 +1669,80 @@ class StatementMixin:
                 guard = yield from self.g_eval_expr(case.guard, scope)
                 if not guard:
                     continue
-            yield from self.g_exec_block(case.body, scope)
-            return
-        return
+            return (yield from self.g_exec_block(case.body, scope))
+        return None
 
     def g_exec_While(self, node: ast.While, scope: RuntimeScope) -> Iterator[Any]:
-        broke = False
+        g_eval_expr = self.g_eval_expr
+        g_exec_block = self.g_exec_block
+        test_node = node.test
+        body = node.body
+        eval_test = None if scope.code.expr_can_suspend(test_node) else self.eval_expr
         while True:
-            test = yield from self.g_eval_expr(node.test, scope)
+            if eval_test is not None:
+                test = eval_test(test_node, scope)
+            else:
+                test = yield from g_eval_expr(test_node, scope)
             if not test:
                 break
             try:
-                yield from self.g_exec_block(node.body, scope)
+                status = yield from g_exec_block(body, scope)
             except ContinueSignal:
                 continue
             except BreakSignal:
-                broke = True
-                break
-        if (not broke) and node.orelse:
-            yield from self.g_exec_block(node.orelse, scope)
-        return
+                return None
+            if status == STATUS_BREAK:
+                return None
+        if node.orelse:
+            return (yield from self.g_exec_block(node.orelse, scope))
+        return None
 
     def g_exec_For(self, node: ast.For, scope: RuntimeScope) -> Iterator[Any]:
-        it = yield from self.g_eval_expr(node.iter, scope)
-        broke = False
+        if scope.code.expr_can_suspend(node.iter):
+            it = yield from self.g_eval_expr(node.iter, scope)
+        else:
+            it = self.eval_expr(node.iter, scope)
+        g_exec_block = self.g_exec_block
+        target = node.target
+        body = node.body
+        fast_locals = None
+        if target.__class__ is ast.Name:
+            store = scope.store
+            name = self._mangle_private_name(target.id, scope)
+            if scope.SCOPE_KIND == SCOPE_FUNCTION:
+                slot = scope.scope_info.slots.get(name)
+                if slot is not None and slot[0] == NAME_LOCAL:
+                    fast_locals = scope.locals
+                    index = slot[1]
+        else:
+            store = None
+            g_assign_target = self.g_assign_target
         for item in it:
-            yield from self.g_assign_target(node.target, item, scope)
+            if fast_locals is not None:
+                fast_locals[index] = item
+            elif store is not None:
+                store(name, item)
+            else:
+                yield from g_assign_target(target, item, scope)
             try:
-                yield from self.g_exec_block(node.body, scope)
+                status = yield from g_exec_block(body, scope)
             except ContinueSignal:
                 continue
             except BreakSignal:
-                broke = True
-                break
-        if (not broke) and node.orelse:
-            yield from self.g_exec_block(node.orelse, scope)
-        return
+                return None
+            if status == STATUS_BREAK:
+                return None
+        if node.orelse:
+            return (yield from self.g_exec_block(node.orelse, scope))
+        return None
 
     def g_exec_AsyncFor(self, node: ast.AsyncFor, scope: RuntimeScope) -> Iterator[Any]:
         iterable = yield from self.g_eval_expr(node.iter, scope)
         iterator = self._async_for_iter(iterable)
-        broke = False
+        g_assign_target = self.g_assign_target
+        g_exec_block = self.g_exec_block
+        target = node.target
+        body = node.body
 
         while True:
             try:
@@ -1485,24 +1761,19 @@ class StatementMixin:
                     raise TypeError(invalid_message) from exc
                 raise
 
-            yield from self.g_assign_target(node.target, item, scope)
+            yield from g_assign_target(target, item, scope)
             try:
-                yield from self.g_exec_block(node.body, scope)
+                status = yield from g_exec_block(body, scope)
             except ContinueSignal:
                 continue
             except BreakSignal:
-                broke = True
-                break
-
-        if (not broke) and node.orelse:
-            yield from self.g_exec_block(node.orelse, scope)
-        return
-
-    def g_exec_Break(self, node: ast.Break, scope: RuntimeScope) -> Iterator[Any]:
-        raise BreakSignal()
+                return None
+            if status == STATUS_BREAK:
+                return None
 
-    def g_exec_Continue(self, node: ast.Continue, scope: RuntimeScope) -> Iterator[Any]:
-        raise ContinueSignal()
+        if node.orelse:
+            return (yield from self.g_exec_block(node.orelse, scope))
+        return None
 
     def g_exec_Return(self, node: ast.Return, scope: RuntimeScope) -> Iterator[Any]:
         val = (yield from self.g_eval_expr(node.value, scope)) if node.value is not None else None
@@ -1514,14 +1785,8 @@ class StatementMixin:
         return
 
     def g_exec_FunctionDef(self, node: ast.FunctionDef, scope: RuntimeScope) -> Iterator[Any]:
-        defaults = []
-        for d in node.args.defaults or []:
-            defaults.append((yield from self.g_eval_expr(d, scope)))
-        kw_defaults = []
-        for d in getattr(node.args, "kw_defaults", []) or []:
-            kw_defaults.append(
-                (yield from self.g_eval_expr(d, scope)) if d is not None else NO_DEFAULT
-            )
+        decorators = yield from self._g_eval_decorators(node.decorator_list, scope)
+        defaults, kw_defaults = yield from self._g_eval_function_defaults(node.args, scope)
         func = self._make_user_function(
             node,
             scope,
@@ -1530,25 +1795,15 @@ class StatementMixin:
             is_async=False,
         )
 
-        decorated: Any = func
-        for dec_node in reversed(node.decorator_list or []):
-            dec = yield from self.g_eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, func)
         self._store_definition_name(scope, node.name, decorated)
         return
 
     def g_exec_AsyncFunctionDef(
         self, node: ast.AsyncFunctionDef, scope: RuntimeScope
     ) -> Iterator[Any]:
-        defaults: list[Any] = []
-        for d in node.args.defaults or []:
-            defaults.append((yield from self.g_eval_expr(d, scope)))
-        kw_defaults: list[Any] = []
-        for d in getattr(node.args, "kw_defaults", []) or []:
-            kw_defaults.append(
-                (yield from self.g_eval_expr(d, scope)) if d is not None else NO_DEFAULT
-            )
+        decorators = yield from self._g_eval_decorators(node.decorator_list, scope)
+        defaults, kw_defaults = yield from self._g_eval_function_defaults(node.args, scope)
         func = self._make_user_function(
             node,
             scope,
@@ -1557,15 +1812,12 @@ class StatementMixin:
             is_async=True,
         )
 
-        decorated: Any = func
-        for dec_node in reversed(node.decorator_list or []):
-            dec = yield from self.g_eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, func)
         self._store_definition_name(scope, node.name, decorated)
         return
 
     def g_exec_ClassDef(self, node: ast.ClassDef, scope: RuntimeScope) -> Iterator[Any]:
+        decorators = yield from self._g_eval_decorators(node.decorator_list, scope)
         type_param_nodes = getattr(node, "type_params", ()) or ()
         type_params = self._build_type_params(type_param_nodes, scope)
         type_param_bindings = self._build_type_param_binding_map(
@@ -1615,94 +1867,89 @@ class StatementMixin:
             private_owner=node.name,
         )
         # class body itself cannot yield (syntax), so normal exec is OK:
-        self.exec_block(node.body, body_scope)
+        self.exec_block_raising(node.body, body_scope)
         self._normalize_class_namespace(class_ns)
 
         cls = mark_runtime_owned(meta(node.name, bases, class_ns, **kw))
         class_cell.value = cls
 
-        decorated: Any = cls
-        for dec_node in reversed(node.decorator_list or []):
-            dec = yield from self.g_eval_expr(dec_node, scope)
-            decorated = dec(decorated)
-
+        decorated = self._apply_decorators(decorators, cls)
         self._store_definition_name(scope, node.name, decorated)
         return
 
     def g_exec_Try(self, node: ast.Try, scope: RuntimeScope) -> Iterator[Any]:
         finalbody_exception = scope.active_exception
+        # A break/continue status from the body or a handler is returned after
+        # the finally clause runs instead of being raised through it.
         try:
-            yield from self.g_exec_block(node.body, scope)
+            status = yield from self.g_exec_block(node.body, scope)
+        except ControlFlowSignal:
+            raise
         except BaseException as e:
-            if isinstance(e, ControlFlowSignal):
-                raise
             finalbody_exception = e
-            handled = False
             for handler in node.handlers:
-                if handler.type is None:
-                    match = True
-                else:
+                if handler.type is not None:
                     exc_type = yield from self.g_eval_expr(handler.type, scope)
-                    match = self._runtime_isinstance(e, exc_type)
-                if match:
-                    handled = True
-                    if handler.name:
-                        scope.store(handler.name, e)
-                    previous_exception = scope.active_exception
-                    scope.active_exception = e
-                    try:
-                        yield from self.g_exec_block(handler.body, scope)
-                    except ControlFlowSignal:
-                        # Returning/breaking/continuing from an except handler
-                        # clears the in-flight exception before finally runs.
-                        finalbody_exception = previous_exception
-                        raise
-                    except BaseException as handler_exc:
-                        finalbody_exception = handler_exc
-                        raise
-                    else:
-                        finalbody_exception = e
-                    finally:
-                        scope.active_exception = previous_exception
-                        if handler.name:
-                            scope.unbind(handler.name)
-                    break
-            if not handled:
+                    # An exact class match needs no isinstance/membrane check.
+                    if exc_type is not type(e) and not self._runtime_isinstance(e, exc_type):
+                        continue
+                name = handler.name
+                if name:
+                    scope.store(name, e)
+                previous_exception = scope.active_exception
+                scope.active_exception = e
+                try:
+                    status = yield from self.g_exec_block(handler.body, scope)
+                except ControlFlowSignal:
+                    # Returning/breaking/continuing from an except handler
+                    # clears the in-flight exception before finally runs.
+                    finalbody_exception = previous_exception
+                    raise
+                except BaseException as handler_exc:
+                    finalbody_exception = handler_exc
+                    raise
+                else:
+                    # Leaving the handler via break/continue clears it too.
+                    finalbody_exception = e if status is None else previous_exception
+                finally:
+                    scope.active_exception = previous_exception
+                    if name:
+                        scope.unbind(name)
+                break
+            else:
                 raise
         else:
-            if node.orelse:
+            if status is None and node.orelse:
                 try:
-                    yield from self.g_exec_block(node.orelse, scope)
+                    status = yield from self.g_exec_block(node.orelse, scope)
+                except ControlFlowSignal:
+                    raise
                 except BaseException as orelse_exc:
-                    if not isinstance(orelse_exc, ControlFlowSignal):
-                        finalbody_exception = orelse_exc
+                    finalbody_exception = orelse_exc
                     raise
         finally:
             if node.finalbody:
                 previous_exception = scope.active_exception
                 scope.active_exception = finalbody_exception
                 try:
-                    yield from self.g_exec_block(node.finalbody, scope)
+                    yield from self.g_exec_block_raising(node.finalbody, scope)
                 finally:
                     scope.active_exception = previous_exception
-        return
+        return status
 
     def g_exec_TryStar(self, node: ast.TryStar, scope: RuntimeScope) -> Iterator[Any]:
+        # Loop control in the body or else clause comes back as a status, as
+        # in exec_Try; except* handlers cannot contain break/continue/return.
+        status = None
         try:
-            yield from self.g_exec_block(node.body, scope)
+            status = yield from self.g_exec_block(node.body, scope)
+        except ControlFlowSignal:
+            raise
         except BaseException as e:
-            if isinstance(e, ControlFlowSignal):
-                raise
-
-            if isinstance(e, py_builtins.BaseExceptionGroup):
-                pending: BaseException | None = e
-                original_was_group = True
-            else:
-                if isinstance(e, Exception):
-                    pending = py_builtins.ExceptionGroup("", [e])
-                else:
-                    pending = py_builtins.BaseExceptionGroup("", [e])
-                original_was_group = False
+            # A lone exception is only wrapped in a group once a handler may
+            # match it; when every handler misses it is re-raised unwrapped.
+            pending: BaseException | None = e
+            original_was_group = isinstance(e, py_builtins.BaseExceptionGroup)
 
             raised: list[BaseException] = []
             for handler in node.handlers:
@@ -1716,6 +1963,10 @@ class StatementMixin:
                     raise TypeError(
                         "catching ExceptionGroup with except* is not allowed. Use except instead."
                     )
+                if pending is e and not original_was_group:
+                    if self._try_star_type_misses(e, exc_type):
+                        continue
+                    pending = self._wrap_try_star_exception(e)
                 matched, pending = self._split_try_star_pending(pending, exc_type)
                 if matched is None:
                     continue
@@ -1729,10 +1980,10 @@ class StatementMixin:
                 except BaseException as current_exception:
                     scope.active_exception = current_exception
                     try:
-                        yield from self.g_exec_block(handler.body, scope)
+                        yield from self.g_exec_block_raising(handler.body, scope)
+                    except ControlFlowSignal:
+                        raise
                     except BaseException as new_e:
-                        if isinstance(new_e, ControlFlowSignal):
-                            raise
                         raised.append(new_e)
                 finally:
                     scope.active_exception = previous_exception
@@ -1746,12 +1997,12 @@ class StatementMixin:
                 raised=raised,
             )
         else:
-            if node.orelse:
-                yield from self.g_exec_block(node.orelse, scope)
+            if status is None and node.orelse:
+                status = yield from self.g_exec_block(node.orelse, scope)
         finally:
             if node.finalbody:
-                yield from self.g_exec_block(node.finalbody, scope)
-        return
+                yield from self.g_exec_block_raising(node.finalbody, scope)
+        return status
 
     def g_exec_Raise(self, node: ast.Raise, scope: RuntimeScope) -> Iterator[Any]:
         if node.exc is None:
@@ -1769,45 +2020,24 @@ class StatementMixin:
         try:
             for item in node.items:
                 mgr = yield from self.g_eval_expr(item.context_expr, scope)
-                enter = getattr(mgr, "__enter__")
-                exit_ = getattr(mgr, "__exit__")
-                val = enter()
+                val, exit_ = self._enter_context_manager(mgr)
                 exits.append(exit_)
                 if item.optional_vars is not None:
                     yield from self.g_assign_target(item.optional_vars, val, scope)
 
-            yield from self.g_exec_block(node.body, scope)
+            status = yield from self.g_exec_block(node.body, scope)
 
         except ControlFlowSignal:
-            for exit_ in reversed(exits):
-                exit_(None, None, None)
-            raise
+            if self._exit_context_managers(exits):
+                raise
 
         except BaseException as e:
-            exc_type = type(e)
-            exc = e
-            tb = e.__traceback__
-
-            for exit_ in reversed(exits):
-                try:
-                    suppress = exit_(exc_type, exc, tb)
-                except BaseException as new_e:
-                    exc_type = type(new_e)
-                    exc = new_e
-                    tb = new_e.__traceback__
-                    continue
-                if suppress:
-                    exc_type = exc = tb = None
-
-            if exc_type is None:
-                return
-            raise exc
+            self._exit_context_managers_with_exception(exits, e)
 
         else:
-            for exit_ in reversed(exits):
-                exit_(None, None, None)
-
-        return
+            if self._exit_context_managers(exits):
+                return status
+        return None
 
     def g_exec_AsyncWith(self, node: ast.AsyncWith, scope: RuntimeScope) -> Iterator[Any]:
         exits = []
@@ -1821,62 +2051,19 @@ class StatementMixin:
                 if item.optional_vars is not None:
                     yield from self.g_assign_target(item.optional_vars, val, scope)
 
-            yield from self.g_exec_block(node.body, scope)
+            status = yield from self.g_exec_block(node.body, scope)
 
         except ControlFlowSignal:
-            for exit_ in reversed(exits):
-                yield AwaitRequest(self._async_with_awaitable(exit_(None, None, None), "__aexit__"))
-            raise
+            if (yield from self._g_exit_async_context_managers(exits)):
+                raise
 
         except BaseException as e:
-            exc_type = type(e)
-            exc = e
-            tb = e.__traceback__
-
-            for exit_ in reversed(exits):
-                try:
-                    suppress = yield AwaitRequest(
-                        self._async_with_awaitable(exit_(exc_type, exc, tb), "__aexit__")
-                    )
-                except BaseException as new_e:
-                    exc_type = type(new_e)
-                    exc = new_e
-                    tb = new_e.__traceback__
-                    continue
-                if suppress:
-                    exc_type = exc = tb = None
-
-            if exc_type is None:
-                return
-            raise exc
+            yield from self._g_exit_async_context_managers_with_exception(exits, e)
 
         else:
-            for exit_ in reversed(exits):
-                yield AwaitRequest(self._async_with_awaitable(exit_(None, None, None), "__aexit__"))
-
-        return
-
-    def g_exec_Import(self, node: ast.Import, scope: RuntimeScope) -> Iterator[Any]:
-        self.exec_Import(node, scope)
-        return
-        yield  # unreachable
-
-    def g_exec_ImportFrom(self, node: ast.ImportFrom, scope: RuntimeScope) -> Iterator[Any]:
-        self.exec_ImportFrom(node, scope)
-        return
-        yield
-
-    def g_exec_TypeAlias(self, node: ast.TypeAlias, scope: RuntimeScope) -> Iterator[Any]:
-        self.exec_TypeAlias(node, scope)
-        return
-        yield
-
-    def g_exec_Global(self, node: ast.Global, scope: RuntimeScope) -> Iterator[Any]:
-        return
-        yield
-
-    def g_exec_Nonlocal(self, node: ast.Nonlocal, scope: RuntimeScope) -> Iterator[Any]:
-        return
-        yield
+            if (yield from self._g_exit_async_context_managers(exits)):
+                return status
+        return None
 
-    # Expressions (generator mode)
+    # Import, ImportFrom, TypeAlias, Global and Nonlocal never suspend, so they
+    # have no g_exec_* twin and g_exec_stmt runs their exec_* handler directly.
@@ -21,52 +21,47 @@ def _table_frees(table: symtable.SymbolTable) -> Set[str]:
 def _contains_yield(fn_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
     """
     True iff this function's body contains Yield/YieldFrom (ignoring nested defs/classes/lambdas).
-    """
-
-    class Finder(ast.NodeVisitor):
-        def __init__(self) -> None:
-            self.found = False
-
-        def visit_Yield(self, node: ast.Yield) -> None:
-            self.found = True
-
-        def visit_YieldFrom(self, node: ast.YieldFrom) -> None:
-            self.found = True
-
-        def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-            return  # don't descend
-
-        def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-            return
 
-        def visit_Lambda(self, node: ast.Lambda) -> None:
-            return
-
-        def visit_ClassDef(self, node: ast.ClassDef) -> None:
-            return
-
-    finder = Finder()
-    for stmt in fn_node.body:
-        if finder.found:
-            break
-        finder.visit(stmt)
-    return finder.found
+    The parts of a nested definition evaluated in this function (decorators,
+    defaults, class bases and keywords) are still scanned.
+    """
+    stack: list[ast.AST] = list(fn_node.body)
+    while stack:
+        node = stack.pop()
+        cls = node.__class__
+        if cls is ast.Yield or cls is ast.YieldFrom:
+            return True
+        if cls is ast.FunctionDef or cls is ast.AsyncFunctionDef or cls is ast.Lambda:
+            args = node.args
+            stack.extend(args.defaults)
+            stack.extend(default for default in args.kw_defaults if default is not None)
+            if cls is not ast.Lambda:
+                stack.extend(node.decorator_list)
+            continue
+        if cls is ast.ClassDef:
+            stack.extend(node.decorator_list)
+            stack.extend(node.bases)
+            stack.extend(keyword.value for keyword in node.keywords)
+            continue
+        stack.extend(ast.iter_child_nodes(node))
+    return False
 
 
 def _collect_target_names(target: ast.AST) -> Set[str]:
+    if target.__class__ is ast.Name:
+        return {target.id}
     names: Set[str] = set()
-
-    def rec(t: ast.AST) -> None:
-        if isinstance(t, ast.Name):
+    stack = [target]
+    while stack:
+        t = stack.pop()
+        cls = t.__class__
+        if cls is ast.Name:
             names.add(t.id)
-        elif isinstance(t, (ast.Tuple, ast.List)):
-            for e in t.elts:
-                rec(e)
-        elif isinstance(t, ast.Starred):
-            rec(t.value)
+        elif cls is ast.Tuple or cls is ast.List:
+            stack.extend(t.elts)
+        elif cls is ast.Starred:
+            stack.append(t.value)
         # ignore Attribute/Subscript/etc
-
-    rec(target)
     return names
 
 
@@ -75,6 +75,78 @@ RESULT = outer()
     assert env["RESULT"] == (24, 21)
 
 
+def test_defs_and_lambdas_reexecuted_in_loop_get_fresh_closures(run_interpreter):
+    source = """
+def build():
+    made = []
+    for n in range(3):
+        def gen(limit):
+            for i in range(limit):
+                yield i * n
+
+        def plain():
+            return n
+
+        made.append((gen, plain, lambda k: k + n))
+    n = 10
+    return [(list(g(2)), p(), f(1)) for g, p, f in made]
+
+RESULT = build()
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [([0, 10], 10, 11)] * 3
+
+
+def test_decorators_evaluate_top_down_before_definition_and_apply_bottom_up(run_interpreter):
+    source = """
+def define(log):
+    def deco(tag):
+        log.append(tag)
+        return lambda obj: (log.append(("apply", tag)), obj)[1]
+
+    @deco(1)
+    @deco(2)
+    def f(a=log.append("default")):
+        pass
+
+    @deco(3)
+    @deco(4)
+    class C(log.append("base") or object):
+        pass
+
+    return log
+
+def define_in_generator(log):
+    def deco(tag):
+        log.append(tag)
+        return lambda obj: (log.append(("apply", tag)), obj)[1]
+
+    @deco((yield) or 1)
+    @deco(2)
+    def f(a=log.append("default")):
+        pass
+
+    @deco(3)
+    @deco(4)
+    class C(log.append("base") or object):
+        pass
+
+    yield log
+
+EXPECTED = [
+    1, 2, "default", ("apply", 2), ("apply", 1),
+    3, 4, "base", ("apply", 4), ("apply", 3),
+]
+RESULT = define([])
+GEN = define_in_generator([])
+next(GEN)
+GEN_RESULT = GEN.send(None)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == env["EXPECTED"]
+    assert env["GEN_RESULT"] == env["EXPECTED"]
+
+
 def test_multiple_lambdas_on_same_line(run_interpreter):
     source = """
 f, g = (lambda x: x + 1, lambda y: y * 2)
@@ -293,6 +365,26 @@ RESULT = run()
     assert env["RESULT"] == 1
 
 
+def test_locals_builtin_reports_cell_and_free_values_but_not_unbound(run_interpreter):
+    source = """
+def outer(a):
+    b = 2
+    def inner():
+        c = a
+        later = 1
+        del later
+        return locals()
+    pending = 0
+    del pending
+    return locals(), inner()
+
+snapshot, inner_snapshot = outer(1)
+RESULT = (sorted(snapshot), snapshot["a"], inner_snapshot)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (["a", "b", "inner"], 1, {"c": 1, "a": 1})
+
+
 def test_exec_builtin_uses_interpreted_function_scope_locals() -> None:
     source = """
 def run():
@@ -698,6 +790,154 @@ RESULT = (r.num(), r.bump(), hasattr(r, "_Rat__num"), hasattr(r, "__num"))
     assert env["RESULT"] == (2, 3, True, False)
 
 
+def test_with_calls_inherited_interpreted_hooks_and_suppresses(run_interpreter):
+    source = """
+class Base:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        self.log.append("enter")
+        return len(self.log)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.log.append(exc_type.__name__ if exc_type else None)
+        return exc_type is KeyError
+
+class Child(Base):
+    pass
+
+def run(log):
+    with Child(log) as first, Base(log) as second:
+        raise KeyError(first + second)
+    return "suppressed"
+
+def gen(log):
+    with Child(log) as value:
+        yield value
+    yield "done"
+
+LOG = []
+RESULT = run(LOG)
+GEN_LOG = []
+GEN = list(gen(GEN_LOG))
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == "suppressed"
+    assert env["LOG"] == ["enter", "enter", "KeyError", None]
+    assert env["GEN"] == [1, "done"]
+    assert env["GEN_LOG"] == ["enter", None]
+
+
+def test_with_exit_errors_on_normal_unwind_reach_outer_managers(run_interpreter):
+    source = """
+log = []
+
+class Rec:
+    def __init__(self, name, fail=False, suppress=False):
+        self.name, self.fail, self.suppress = name, fail, suppress
+    def __enter__(self):
+        return self
+    def __exit__(self, et, e, tb):
+        log.append((self.name, et.__name__ if et else None))
+        if self.fail:
+            raise KeyError(self.name)
+        return self.suppress
+
+def normal():
+    try:
+        with Rec("a"), Rec("b", fail=True):
+            pass
+    except KeyError as exc:
+        log.append(("caught", exc.args[0]))
+
+def looped():
+    for i in range(2):
+        with Rec("outer", suppress=True), Rec("inner", fail=True):
+            log.append(("body", i))
+            continue
+        log.append(("after", i))
+    return "done"
+
+def returned():
+    with Rec("outer", suppress=True), Rec("inner", fail=True):
+        return "early"
+    return "late"
+
+def gen():
+    with Rec("g-outer", suppress=True), Rec("g-inner", fail=True):
+        yield 1
+        return
+    yield 2
+
+normal()
+RESULT = (looped(), returned(), list(gen()), log)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        "done",
+        "late",
+        [1, 2],
+        [
+            ("b", None),
+            ("a", "KeyError"),
+            ("caught", "b"),
+            ("body", 0),
+            ("inner", None),
+            ("outer", "KeyError"),
+            ("after", 0),
+            ("body", 1),
+            ("inner", None),
+            ("outer", "KeyError"),
+            ("after", 1),
+            ("inner", None),
+            ("outer", "KeyError"),
+            ("g-inner", None),
+            ("g-outer", "KeyError"),
+        ],
+    )
+
+
+def test_with_looks_up_hooks_on_type_and_reports_missing_protocol(run_interpreter):
+    source = """
+class InstanceOnly:
+    def __init__(self):
+        self.__enter__ = lambda: "instance"
+        self.__exit__ = lambda *exc: False
+
+class EnterOnly:
+    def __enter__(self):
+        return self
+
+class Static:
+    @staticmethod
+    def __enter__():
+        return "static"
+
+    @classmethod
+    def __exit__(cls, *exc):
+        return cls is Static
+
+def message(factory):
+    try:
+        with factory():
+            pass
+    except TypeError as exc:
+        return str(exc)
+
+with Static() as STATIC_VALUE:
+    raise KeyError("suppressed by classmethod exit")
+
+MESSAGES = (message(InstanceOnly), message(EnterOnly))
+"""
+    env = run_interpreter(source)
+    assert env["STATIC_VALUE"] == "static"
+    assert env["MESSAGES"] == (
+        "'InstanceOnly' object does not support the context manager protocol",
+        "'EnterOnly' object does not support the context manager protocol (missed __exit__ method)",
+    )
+
+
 def test_class_private_with_target_name_is_mangled(run_interpreter):
     source = """
 class C:
@@ -732,6 +972,208 @@ RESULT = C().f()
     assert env["RESULT"] == 6
 
 
+def test_class_private_plain_and_chained_assign_targets_are_mangled(run_interpreter):
+    source = """
+class C:
+    __a = __b = 1
+    plain = 2
+
+    def gen(self):
+        __y = self.plain
+        __z = [__w] = [__y + 1]
+        yield (__y, __z, __w)
+
+RESULT = (
+    sorted(name for name in vars(C) if "__" in name and not name.endswith("__")),
+    next(C().gen()),
+)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (["_C__a", "_C__b"], (2, [3], 3))
+
+
+def test_class_private_for_loop_targets_are_mangled(run_interpreter):
+    source = """
+class C:
+    for __i in range(2):
+        pass
+
+    def total(self):
+        acc = 0
+        for __j in range(4):
+            acc += __j
+        return acc, __j
+
+    def gen(self):
+        for __k in "ab":
+            yield __k
+        yield __k
+
+RESULT = ("_C__i" in vars(C), C().total(), list(C().gen()))
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (True, (6, 3), ["a", "b", "b"])
+
+
+def test_class_private_names_strip_owner_underscores_and_skip_dunder_owners(run_interpreter):
+    source = """
+class _Foo:
+    __x = 1
+
+    def get(self):
+        return self.__x
+
+
+class __:
+    __y = 2
+
+
+RESULT = [
+    ("_Foo__x" in vars(_Foo), _Foo().get()),
+    ("__y" in vars(__), "___y" in vars(__)),
+    [_Foo().get() for _ in range(3)],
+]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [(True, 1), (True, False), [1, 1, 1]]
+
+
+def test_for_loop_function_targets_bind_locals_cells_and_globals(run_interpreter):
+    source = """
+G = None
+
+def run():
+    global G
+    total = 0
+    for i in range(4):
+        total += i
+    for c in "xyz":
+        pass
+    read_c = lambda: c
+    for G in (1, 2):
+        pass
+
+    def gen():
+        for j in range(3):
+            yield j
+        yield j
+
+    return total, i, read_c(), list(gen())
+
+RESULT = (run(), G)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == ((6, 3, "z", [0, 1, 2, 2]), 2)
+
+
+def test_zero_arg_super_reads_first_parameter_from_call_layout(run_interpreter):
+    source = """
+class A:
+    def m(self, tag=""):
+        return "A" + tag
+
+class B(A):
+    def mangled(__s):
+        return super().m("B")
+    def posonly(self, /, tag):
+        return super().m(tag)
+
+b = B()
+RESULT = [b.mangled(), b.posonly("p"), b.mangled()]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == ["AB", "Ap", "AB"]
+
+
+def test_repeated_calls_bind_mangled_and_special_parameters(run_interpreter):
+    source = """
+class C:
+    def m(self, __a, /, b=2, *__rest, __k, c=3, **__kw):
+        return __a, b, __rest, __k, c, __kw
+
+    def check(self):
+        out = []
+        for i in range(2):
+            out.append(self.m(i, _C__k=9))
+            out.append(self.m(i, 5, 6, 7, _C__k=8, x=1))
+        try:
+            self.m(1)
+        except TypeError as exc:
+            out.append(str(exc))
+        return out
+
+RESULT = C().check()
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [
+        (0, 2, (), 9, 3, {}),
+        (0, 5, (6, 7), 8, 3, {"x": 1}),
+        (1, 2, (), 9, 3, {}),
+        (1, 5, (6, 7), 8, 3, {"x": 1}),
+        "m() missing required keyword-only argument '_C__k'",
+    ]
+
+
+def test_try_body_and_handler_loop_control_runs_finally_and_skips_else(run_interpreter):
+    source = """
+def trace():
+    log = []
+    for i in range(4):
+        try:
+            if i == 0:
+                continue
+            if i == 1:
+                raise KeyError(i)
+            if i == 3:
+                break
+        except KeyError:
+            log.append(("handler", i))
+            continue
+        else:
+            log.append(("else", i))
+        finally:
+            log.append(("finally", i))
+        log.append(("after", i))
+    return log
+
+def gen():
+    for i in range(3):
+        try:
+            if i == 1:
+                raise ValueError
+            yield ("body", i)
+            if i == 2:
+                break
+        except ValueError:
+            yield ("handler", i)
+            continue
+        finally:
+            yield ("finally", i)
+
+RESULT = (trace(), list(gen()))
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        [
+            ("finally", 0),
+            ("handler", 1),
+            ("finally", 1),
+            ("else", 2),
+            ("finally", 2),
+            ("after", 2),
+            ("finally", 3),
+        ],
+        [
+            ("body", 0),
+            ("finally", 0),
+            ("handler", 1),
+            ("finally", 1),
+            ("body", 2),
+            ("finally", 2),
+        ],
+    )
+
+
 def test_class_private_method_definition_name_is_mangled(run_interpreter):
     source = """
 class Vector:
@@ -748,6 +1190,18 @@ RESULT = (v.apply(2), hasattr(Vector, "_Vector__cast"), hasattr(Vector, "__cast"
     assert env["RESULT"] == (3, True, False)
 
 
+def test_class_private_vararg_and_kwarg_names_are_mangled(run_interpreter):
+    source = """
+class C:
+    def f(self, *__args, **__kwargs):
+        return __args, __kwargs
+
+RESULT = (C().f(1, 2, x=3), C().f())
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (((1, 2), {"x": 3}), ((), {}))
+
+
 @pytest.mark.skipif(not HAS_TYPE_ALIAS, reason="TypeAlias requires Python 3.12+")
 def test_typealias_statement_builds_runtime_alias_with_params(run_interpreter):
     source = """
@@ -833,6 +1287,36 @@ RESULT = (callable(f.__annotate__), f.__annotate__(1))
     assert env["RESULT"] == (True, {"value": int})
 
 
+def test_user_function_annotate_callables_are_distinct_per_definition(run_interpreter):
+    source = """
+import inspect
+
+def make():
+    def f(value: int):
+        return value
+    return f
+
+f1 = make()
+f2 = make()
+f1.__annotations__ = {"value": str}
+RESULT = (
+    f1.__annotate__ is f2.__annotate__,
+    f1.__annotate__(1),
+    f2.__annotate__(1),
+    str(inspect.signature(f2.__annotate__)),
+    f2.__annotate__.__qualname__,
+)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        False,
+        {"value": str},
+        {"value": int},
+        "(format, /)",
+        "make.<locals>.f.__annotate__",
+    )
+
+
 def test_user_function_annotations_assignment_remains_allowed(run_interpreter):
     source = """
 def f(value: int):
@@ -1091,6 +1575,30 @@ RESULT = Outer.Inner.marker is Outer.__type_params__[0]
     assert env["RESULT"] is True
 
 
+@pytest.mark.skipif(not HAS_TYPE_PARAMS, reason="Type params require Python 3.12+")
+def test_deeply_nested_generic_class_bodies_resolve_each_type_param(run_interpreter):
+    source = """
+marker = "global"
+
+def build():
+    local = "local"
+    class A[T]:
+        class B[U]:
+            class C[T]:
+                seen = (T, U, local, marker)
+    return A
+
+A = build()
+a_t, = A.__type_params__
+b_u, = A.B.__type_params__
+c_t, = A.B.C.__type_params__
+seen = A.B.C.seen
+RESULT = (seen[0] is c_t, seen[0] is not a_t, seen[1] is b_u, seen[2:])
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (True, True, True, ("local", "global"))
+
+
 @pytest.mark.skipif(not HAS_TYPE_PARAMS, reason="Type params require Python 3.12+")
 def test_generic_class_typevar_bounds_are_lazily_evaluated(run_interpreter):
     source = """
@@ -1146,6 +1654,24 @@ RESULT = build()
     assert env["RESULT"] == ("NameError", "NameError", "defined", ("defined",))
 
 
+@pytest.mark.skipif(not HAS_TYPE_PARAMS, reason="Type params require Python 3.12+")
+def test_same_shape_lazy_typevars_resolve_their_own_bounds(run_interpreter):
+    source = """
+def build(value):
+    class Foo[T: Later, U: (Later, Other)]:
+        pass
+
+    Later = value
+    Other = value * 2
+    T, U = Foo.__type_params__
+    return T.__bound__, U.__constraints__
+
+RESULT = [build(1), build(2), build(3)]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [(1, (1, 2)), (2, (2, 4)), (3, (3, 6))]
+
+
 def test_async_function_def_returns_coroutine(run_interpreter):
     source = """
 async def add(x, y=3):
@@ -1307,6 +1833,71 @@ CORO = run()
     assert env["EVENTS"] == ["enter", "ValueError"]
 
 
+def test_async_with_exit_errors_on_normal_unwind_reach_outer_managers(run_interpreter):
+    source = """
+log = []
+
+class Rec:
+    def __init__(self, name, fail=False, suppress=False):
+        self.name, self.fail, self.suppress = name, fail, suppress
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, et, e, tb):
+        log.append((self.name, et.__name__ if et else None))
+        if self.fail:
+            raise KeyError(self.name)
+        return self.suppress
+
+async def normal():
+    try:
+        async with Rec("a"), Rec("b", fail=True):
+            pass
+    except KeyError as exc:
+        log.append(("caught", exc.args[0]))
+
+async def looped():
+    for i in range(2):
+        async with Rec("outer", suppress=True), Rec("inner", fail=True):
+            log.append(("body", i))
+            continue
+        log.append(("after", i))
+    return "done"
+
+async def returned():
+    async with Rec("outer", suppress=True), Rec("inner", fail=True):
+        return "early"
+    return "late"
+
+async def run():
+    await normal()
+    return (await looped(), await returned(), log)
+
+CORO = run()
+"""
+    env = run_interpreter(source)
+    with pytest.raises(StopIteration) as exc_info:
+        env["CORO"].send(None)
+    assert exc_info.value.value == (
+        "done",
+        "late",
+        [
+            ("b", None),
+            ("a", "KeyError"),
+            ("caught", "b"),
+            ("body", 0),
+            ("inner", None),
+            ("outer", "KeyError"),
+            ("after", 0),
+            ("body", 1),
+            ("inner", None),
+            ("outer", "KeyError"),
+            ("after", 1),
+            ("inner", None),
+            ("outer", "KeyError"),
+        ],
+    )
+
+
 def test_async_with_requires_aexit_method(run_interpreter):
     source = """
 BODY = None
@@ -1395,6 +1986,92 @@ CORO_EXIT = run_exit()
         env["CORO_EXIT"].send(None)
 
 
+def test_loop_control_crosses_nested_if_with_match_and_try_blocks(run_interpreter):
+    source = """
+class Tracker:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        self.log.append("enter")
+        return self
+
+    def __exit__(self, *exc):
+        self.log.append("exit")
+        return False
+
+def walk(values, log):
+    seen = []
+    for value in values:
+        if value % 2:
+            with Tracker(log):
+                match value:
+                    case 3:
+                        continue
+                    case 7:
+                        break
+        try:
+            if value == 4:
+                continue
+        finally:
+            log.append(("finally", value))
+        seen.append(value)
+    else:
+        seen.append("else")
+    return seen
+
+def counting(limit):
+    n = 0
+    while True:
+        n += 1
+        if n < limit:
+            continue
+        with Tracker([]):
+            break
+    else:
+        n = -1
+    return n
+
+def gen_walk(values):
+    for value in values:
+        if value == 2:
+            continue
+        with Tracker([]):
+            if value == 4:
+                break
+        yield value
+    else:
+        yield "else"
+
+LOG = []
+SEEN = walk([1, 2, 3, 4, 5, 7, 8], LOG)
+SEEN_ELSE = walk([2, 6], [])
+COUNT = counting(5)
+GEN = list(gen_walk([1, 2, 3, 4, 5]))
+GEN_ELSE = list(gen_walk([1, 2]))
+"""
+    env = run_interpreter(source)
+    assert env["SEEN"] == [1, 2, 5]
+    assert env["LOG"] == [
+        "enter",
+        "exit",
+        ("finally", 1),
+        ("finally", 2),
+        "enter",
+        "exit",
+        ("finally", 4),
+        "enter",
+        "exit",
+        ("finally", 5),
+        "enter",
+        "exit",
+    ]
+    assert env["SEEN_ELSE"] == [2, 6, "else"]
+    assert env["COUNT"] == 5
+    assert env["GEN"] == [1, 3]
+    assert env["GEN_ELSE"] == [1, "else"]
+
+
 def test_async_for_supports_loop_control_and_else(run_interpreter):
     source = """
 class AsyncCounter:
@@ -1549,6 +2226,83 @@ CORO = run()
     assert exc_info.value.value == ([3, 9], True, True)
 
 
+def test_yield_in_nested_definition_defaults_and_bases_makes_outer_generator(run_interpreter):
+    source = """
+def outer():
+    @(yield "decorator")
+    def inner(x=(yield "default"), *, y=(yield "kwdefault")):
+        yield "never"
+    class C((yield "base"), metaclass=(yield "meta")):
+        pass
+    return (inner(), C, (lambda z=(yield "lambda"): z)())
+
+def plain():
+    def inner():
+        yield 1
+    class C:
+        def method(self):
+            yield 2
+    return lambda: (yield 3)
+
+gen = outer()
+LOG = [next(gen)]
+for value in (lambda fn: fn, 1, 2, object, type):
+    LOG.append(gen.send(value))
+try:
+    gen.send("z")
+except StopIteration as stop:
+    inner_gen, cls, z = stop.value
+    RESULT = (type(inner_gen).__name__, cls.__name__, z, type(plain()).__name__)
+"""
+    env = run_interpreter(source)
+    assert env["LOG"] == ["decorator", "default", "kwdefault", "base", "meta", "lambda"]
+    assert env["RESULT"] == ("generator", "C", "z", "UserFunction")
+
+
+def test_generator_conditions_and_iterables_may_suspend_or_run_plainly(run_interpreter):
+    source = """
+class AsyncCounter:
+    def __init__(self, values):
+        self.values = list(values)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for value in self.values:
+            yield value
+
+def gen():
+    if (yield "if"):
+        yield "then"
+    for item in (yield "for"):
+        yield item
+    while (yield "while"):
+        yield "loop"
+    assert (yield "assert"), "nope"
+    if [x for x in range(3)] and len("ab") == 2:
+        yield "plain"
+
+async def run():
+    seen = []
+    if [v async for v in AsyncCounter([1])]:
+        seen.append("async-if")
+    for v in [v * 2 async for v in AsyncCounter([1, 2])]:
+        seen.append(v)
+    return seen
+
+g = gen()
+LOG = [next(g), g.send(True), next(g), g.send(["a"]), next(g), g.send(True), next(g)]
+LOG += [g.send(False), g.send(True)]
+CORO = run()
+"""
+    env = run_interpreter(source)
+    assert env["LOG"] == ["if", "then", "for", "a", "while", "loop", "while", "assert", "plain"]
+    with pytest.raises(StopIteration) as exc_info:
+        env["CORO"].send(None)
+    assert exc_info.value.value == ["async-if", 2, 4]
+
+
 def test_generator_expression_with_nested_async_comprehension_is_async(run_interpreter):
     source = """
 class AsyncCounter:
@@ -1914,6 +2668,62 @@ except* ValueError as exc:
     assert env["RESULT"] == ("ExceptionGroup", 1, "ValueError", "boom")
 
 
+def test_trystar_unmatched_single_exception_is_reraised_unwrapped(run_interpreter):
+    source = """
+def plain(exc):
+    try:
+        try:
+            raise exc
+        except* KeyError:
+            return "key"
+        except* (TypeError, OSError):
+            return "type"
+    except BaseException as caught:
+        return caught is exc
+
+def gen(exc):
+    try:
+        try:
+            raise exc
+        except* KeyError:
+            yield "key"
+        except* ValueError as group:
+            yield (type(group).__name__, group.exceptions[0] is exc)
+    except BaseException as caught:
+        yield caught is exc
+
+def bad_type():
+    try:
+        raise ValueError("x")
+    except* int:
+        pass
+
+err = ValueError("boom")
+try:
+    bad_type()
+except TypeError:
+    BAD = "TypeError"
+
+RESULT = (
+    plain(err),
+    plain(SystemExit(2)),
+    list(gen(err)),
+    list(gen(KeyError("k"))),
+    list(gen(SystemExit())),
+    BAD,
+)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        True,
+        True,
+        [("ExceptionGroup", True)],
+        ["key"],
+        [True],
+        "TypeError",
+    )
+
+
 def test_trystar_splits_and_reraises_unhandled_group_members(run_interpreter):
     source = """
 try:
@@ -1946,6 +2756,65 @@ RESULT = list(run())
     assert env["RESULT"] == [("value", ["ValueError"]), ("type", ["TypeError"])]
 
 
+def test_trystar_body_loop_control_runs_finally_and_skips_else(run_interpreter):
+    source = """
+def trace():
+    log = []
+    for i in range(4):
+        try:
+            if i == 0:
+                continue
+            if i == 1:
+                raise ValueError(i)
+            if i == 3:
+                break
+        except* ValueError:
+            log.append(("handler", i))
+        else:
+            log.append(("else", i))
+        finally:
+            log.append(("finally", i))
+    return log
+
+def gen():
+    for i in range(3):
+        try:
+            yield ("body", i)
+            if i == 1:
+                continue
+            if i == 2:
+                break
+        except* ValueError:
+            pass
+        else:
+            yield ("else", i)
+        finally:
+            yield ("finally", i)
+
+RESULT = (trace(), list(gen()))
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        [
+            ("finally", 0),
+            ("handler", 1),
+            ("finally", 1),
+            ("else", 2),
+            ("finally", 2),
+            ("finally", 3),
+        ],
+        [
+            ("body", 0),
+            ("else", 0),
+            ("finally", 0),
+            ("body", 1),
+            ("finally", 1),
+            ("body", 2),
+            ("finally", 2),
+        ],
+    )
+
+
 def test_trystar_sys_exception_tracks_matched_subgroup(run_interpreter):
     source = """
 try:
@@ -2090,6 +2959,28 @@ RESULT = results
     ]
 
 
+def test_match_pattern_dispatch_uses_subclass_matcher_overrides():
+    class LoggingInterpreter(Interpreter):
+        def _match_value_pattern(self, pattern, subject, scope, bindings):
+            self.matched.append(subject)
+            return super()._match_value_pattern(pattern, subject, scope, bindings)
+
+    interpreter = LoggingInterpreter()
+    interpreter.matched = []
+    env = interpreter.make_default_env()
+    source = """
+match 2:
+    case 1:
+        RESULT = "one"
+    case [2] | 2:
+        RESULT = "two"
+"""
+    interpreter.run_or_raise(source, env=env)
+
+    assert env["RESULT"] == "two"
+    assert interpreter.matched == [2, 2]
+
+
 def test_match_guard_false_keeps_capture_bindings(run_interpreter):
     source = """
 class A:
@@ -2109,6 +3000,167 @@ RESULT = (x, y, outcome)
     assert env["RESULT"] == (0, 0, "third")
 
 
+def test_match_mapping_rejects_duplicate_value_keys_and_collects_rest(run_interpreter):
+    source = """
+class K:
+    A = "a"
+    ALSO_A = "a"
+    ONE = 1.0
+
+def dup(subject):
+    try:
+        match subject:
+            case {K.A: _, K.ALSO_A: _}:
+                return "matched"
+    except ValueError as exc:
+        return str(exc)
+
+match {"a": 1, True: 2, 1.5: 3, "z": 4}:
+    case {K.A: a, K.ONE: one, **rest}:
+        matched = (a, one, rest)
+
+RESULT = (dup({"a": 1}), dup({"a": 1, "b": 2}), matched)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        None,
+        "mapping pattern checks duplicate key ('a')",
+        (1, 2, {1.5: 3, "z": 4}),
+    )
+
+
+def test_match_sequence_star_patterns_repeat_across_subject_kinds(run_interpreter):
+    source = """
+def split(subject):
+    match subject:
+        case [first, *middle, last]:
+            return first, middle, last
+        case [only]:
+            return only
+        case _:
+            return None
+
+RESULT = [split(s) for s in ([1, 2, 3, 4], (5, 6), range(3), [7], "ab", [])]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [(1, [2, 3], 4), (5, [], 6), (0, [1], 2), 7, None, None]
+
+
+def test_match_class_pattern_handles_builtin_self_types_and_unhashable_classes(run_interpreter):
+    source = """
+class Meta(type):
+    def __eq__(cls, other):
+        return False
+
+class Point(metaclass=Meta):
+    pass
+
+def describe(subject):
+    match subject:
+        case int(n):
+            return ("int", n)
+        case str(s):
+            return ("str", s)
+        case Point(x):
+            return ("point", x)
+    return None
+
+try:
+    describe(Point())
+except TypeError as exc:
+    error = str(exc)
+
+RESULT = [describe(3), describe("a"), describe(1.5), error]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [
+        ("int", 3),
+        ("str", "a"),
+        None,
+        "Point() accepts 0 positional sub-patterns",
+    ]
+
+
+def test_match_mapping_checks_size_first_and_stops_at_first_missing_key(run_interpreter):
+    source = """
+calls = []
+
+class Keys:
+    def __getattr__(self, name):
+        calls.append(name)
+        return name
+
+K = Keys()
+
+class Tracking(dict):
+    def get(self, key, default=None):
+        calls.append(("get", key))
+        return super().get(key, default)
+
+def probe(subject):
+    match subject:
+        case {K.a: _, K.b: _, K.c: _}:
+            return "matched"
+    return "no match"
+
+small = probe(Tracking(a=1))
+small_calls = list(calls)
+calls.clear()
+miss = probe(Tracking(x=1, b=2, c=3))
+RESULT = (small, small_calls, miss, calls)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        "no match",
+        [],
+        "no match",
+        ["a", "b", "c", ("get", "a")],
+    )
+
+
+def test_match_class_pattern_rereads_reassigned_match_args(run_interpreter):
+    source = """
+class Point:
+    __match_args__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def first(p):
+    match p:
+        case Point(a, y=b):
+            return a, b
+
+p = Point(1, 2)
+before = first(p)
+Point.__match_args__ = ("y",)
+try:
+    first(p)
+except TypeError as exc:
+    after = str(exc)
+RESULT = (before, after)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == ((1, 2), "Point() got multiple sub-patterns for 'y'")
+
+
+def test_match_or_alternatives_discard_partial_bindings(run_interpreter):
+    source = """
+def pick(subject):
+    match subject:
+        case [x, 0] | [_, x]:
+            return ("seq", x)
+        case {"a": a, "b": 0} | {"a": _, "c": a}:
+            return ("map", a)
+    return None
+
+RESULT = [pick([5, 0]), pick([5, 7]), pick({"a": 1, "b": 0}), pick({"a": 1, "b": 2, "c": 3})]
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == [("seq", 5), ("seq", 7), ("map", 1), ("map", 3)]
+
+
 def test_match_works_in_generator_execution_path(run_interpreter):
     source = """
 def classify(values):
@@ -2481,6 +3533,29 @@ RESULT = x
     assert env["RESULT"] == 99
 
 
+def test_nested_and_starred_comprehension_targets_stay_local(run_interpreter):
+    source = """
+class Box:
+    pass
+
+a = b = c = rest = "outer"
+box = Box()
+flat = [(a, b, c, rest) for (a, [b, *rest]), c in [((1, [2, 3, 4]), 5)]]
+stored = [box.value for box.value in range(3)]
+RESULT = (flat, stored, a, b, c, rest, box.value)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        [(1, 2, 5, [3, 4])],
+        [0, 1, 2],
+        "outer",
+        "outer",
+        "outer",
+        "outer",
+        2,
+    )
+
+
 def test_list_comprehension_lambda_closure_uses_shared_iteration_cell(run_interpreter):
     source = """
 items = [(lambda: i) for i in range(5)]
@@ -2490,6 +3565,43 @@ RESULT = [fn() for fn in items]
     assert env["RESULT"] == [4, 4, 4, 4, 4]
 
 
+def test_single_and_multi_target_comprehensions_resolve_outer_names(run_interpreter):
+    source = """
+def build(scale):
+    nested = [[x * y * scale for y in range(2)] for x in range(3)]
+    pairs = {a: b * scale for a, b in [(1, 2), (3, 4)]}
+    total = sum(x * scale for x in range(4))
+    return nested, pairs, total
+
+RESULT = build(10)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == ([[0, 0], [0, 10], [0, 20]], {1: 20, 3: 40}, 60)
+
+
+def test_single_target_comprehensions_leave_shared_empty_locals_untouched(run_interpreter):
+    from pynterp import scopes
+
+    source = """
+def build(scale):
+    fns = [lambda: x * scale for x in range(3)]
+    seen = [sorted(locals()) for x in range(1)]
+    doubled = {x: x * 2 for x in range(2)}
+    nested = [(x, [x for x in "ab"]) for x in (1,)]
+    return [fn() for fn in fns], seen, doubled, nested
+
+RESULT = build(10)
+"""
+    env = run_interpreter(source)
+    assert env["RESULT"] == (
+        [20, 20, 20],
+        [["x"]],
+        {0: 0, 1: 2},
+        [(1, ["a", "b"])],
+    )
+    assert scopes._NO_COMPREHENSION_LOCALS == {}
+
+
 def test_class_scope_comprehension_lambda_closure_and_class_cell(run_interpreter):
     source = """
 class C:
@@ -3041,3 +4153,36 @@ RESULT = helper.FLAG
     interpreter.run(source, env=env, filename=str(subpackage / "consumer.py"))
 
     assert env["RESULT"] == "ok"
+
+
+def test_module_loader_reuses_cached_parse_until_file_changes(tmp_path):
+    import os
+
+    from pynterp.lib import module_loader
+
+    package = tmp_path / "pkg_loader_cache"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    helper = package / "helper.py"
+    helper.write_text("VALUE = 1\n")
+
+    def load_value():
+        interpreter = Interpreter(allowed_imports=None)
+        env = interpreter.make_default_env(package_root=package, package_name="pkg_loader_cache")
+        interpreter.run_or_raise("from pkg_loader_cache.helper import VALUE\n", env=env)
+        return env["VALUE"]
+
+    assert load_value() == 1
+    key = str(helper)
+    cached = module_loader._SOURCE_CACHE[key]
+    assert load_value() == 1
+    assert module_loader._SOURCE_CACHE[key] is cached
+    cache_size = len(module_loader._SOURCE_CACHE)
+
+    helper.write_text("VALUE = 2\n")
+    stat = helper.stat()
+    os.utime(helper, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_value() == 2
+    # The edited file replaces its entry rather than adding a second one.
+    assert len(module_loader._SOURCE_CACHE) == cache_size
+    assert module_loader._SOURCE_CACHE[key][0] == helper.stat().st_mtime_ns
@@ -14032,6 +14032,7 @@ def test_imported_host_instance_method_annotations_cannot_be_reassigned():
         "builtins",
         "closure",
         "code",
+        "free_cells",
         "globals",
         "node",
         "scope_info",
@@ -14061,6 +14062,7 @@ RESULT = getattr(f, ATTR_NAME)
         "builtins",
         "closure",
         "code",
+        "free_cells",
         "globals",
         "node",
         "scope_info",